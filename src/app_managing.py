@@ -1,24 +1,32 @@
 import shlex
 from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Iterator, Callable, Any
+from typing import Iterator, Callable, Any, Optional
 
 import pydash as _
 from more_itertools.more import seekable
 from requests import Session
+from requests.adapters import HTTPAdapter
 
+from src.batch_managing import BatchMgr, BatchSummary
 from src.conf import ConfFileMgr
+from src.constants import ScrapConstants
 from src.context import Context
+from src.daemon_managing import DaemonMgr
 from src.exceptions import ScrapLangException
 from src.input_managing import InputMgr
+from src.input_managing.cli import CLI
 from src.lang_detecting.preprocessing.data import DataProcessor
-from src.logutils import setup_logging
+from src.logutils import setup_logging, keep_logging
 from src.migration_managing import MigrationManager
 from src.printer import Printer
 from src.input_managing.data_gathering import DataGatherer
 from src.resouce_managing.valid_data import ValidDataMgr
 from src.scrapping import ScrapMgr
-from src.scrapping.core.web_building import get_default_headers
+from src.scrapping.core.caching import ResponseCache, ResultCache
+from src.scrapping.core.web_building import get_default_headers, StaleRetry
+from src.server_managing import ServerMgr
 from pydash import chain as c
 
 
@@ -29,40 +37,114 @@ class AppMgr:
                  short_mem_file: Path | str = None,
                  lang_script_file: Path | str = None,
                  printer: Callable[[str], Any] = None,
+                 response_cache_dir: Path | str = None,
+                 result_cache_dir: Path | str = None,
         ):
         setup_logging()
         self.conf_mgr = ConfFileMgr(conf_path)  # TODO: Move paths to context and work from there
         self.context: Context = Context(self.conf_mgr.conf)
-        self.valid_data_mgr = ValidDataMgr(valid_data_file, context=self.context) if valid_data_file else None  # TODO: Rework
-        self.conf_mgr.valid_data_mgr = self.valid_data_mgr
-        self.data_processor = DataProcessor(valid_data_mgr=self.valid_data_mgr , lang_script_file=lang_script_file)
-        self.data_gatherer = DataGatherer(context=self.context, valid_data_mgr=self.valid_data_mgr, short_mem_file=short_mem_file, data_processor=self.data_processor)
-        self.input_mgr = InputMgr(context=self.context, data_processor=self.data_processor)
-        self.scrap_mgr = ScrapMgr()
-        self.printer = Printer(context=self.context, printer=printer)
-        self.migration_mgr = MigrationManager(self.valid_data_mgr)
+        self._valid_data_file = valid_data_file
+        self._short_mem_file = short_mem_file
+        self._lang_script_file = lang_script_file
+        self._print = printer
+        self._response_cache_dir = response_cache_dir
+        self._result_cache_dir = result_cache_dir
+        self._session: Optional[Session] = None
+
+    # The subsystems are set up on their first use, their files loaded only once needed and logged when they are
+
+    @cached_property
+    def valid_data_mgr(self) -> Optional[ValidDataMgr]:
+        return ValidDataMgr(self._valid_data_file, context=self.context) if self._valid_data_file else None  # TODO: Rework
+
+    @cached_property
+    def data_processor(self) -> DataProcessor:
+        return DataProcessor(valid_data_mgr=self.valid_data_mgr, lang_script_file=self._lang_script_file)
+
+    @cached_property
+    def data_gatherer(self) -> DataGatherer:
+        return DataGatherer(context=self.context, valid_data_mgr=self.valid_data_mgr, short_mem_file=self._short_mem_file, data_processor=self.data_processor)
+
+    @cached_property
+    def input_mgr(self) -> InputMgr:
+        return InputMgr(context=self.context, data_processor=self.data_processor)
+
+    @cached_property
+    def scrap_mgr(self) -> ScrapMgr:
+        return ScrapMgr(
+            response_cache=ResponseCache(self._response_cache_dir) if self._response_cache_dir else None,
+            result_cache=ResultCache(self._result_cache_dir),
+        )
+
+    @cached_property
+    def printer(self) -> Printer:
+        return Printer(context=self.context, printer=self._print)
+
+    @cached_property
+    def migration_mgr(self) -> MigrationManager:
+        return MigrationManager(self.valid_data_mgr)
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    @classmethod
+    def _create_session(cls) -> Session:
+        session = Session()
+        session.headers.update(get_default_headers())
+        retries = StaleRetry(total=ScrapConstants.STALE_RETRIES, connect=ScrapConstants.STALE_RETRIES, read=0, status=0, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=ScrapConstants.POOL_HOSTS, pool_maxsize=ScrapConstants.POOL_SIZE, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     @contextmanager
     def connect(self) -> Iterator[Session]:
-        session = None
-        try:
-            session = Session()
-            session.headers.update(get_default_headers())
-            self.scrap_mgr.session = session
-            yield session
-        finally:
+        """
+        Keeps the session and its connections for the next scraps, until closed
+        """
+        self.scrap_mgr.session = self.session
+        yield self.session
+
+    def close(self) -> None:
+        if 'scrap_mgr' in vars(self):
             self.scrap_mgr.session = None
-            if session:
-                session.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def run(self) -> None:
         if self.migration_mgr.is_migration_needed():
             self.migration_mgr.migrate()
-        self.run_single()
-        while self.context.loop:
-            from_langs, to_langs = c().at('from_langs', 'to_langs').map(','.join)(self.context)
-            self.printer.print_secondary(f'{from_langs}>{to_langs}❯❯ ', end='')
-            self.run_single(shlex.split(input()))
+        try:
+            self.run_single()
+            if self.context.daemon:
+                DaemonMgr(self).serve()
+            if self.context.serve is not None:
+                self.serve(self.context.serve)
+            if self.context.batch:
+                self.run_batch(self.context.batch)
+            while self.context.loop:
+                from_langs, to_langs = c().at('from_langs', 'to_langs').map(','.join)(self.context)
+                self.printer.print_secondary(f'{from_langs}>{to_langs}❯❯ ', end='')
+                self.warm_up()
+                self.run_single(shlex.split(input()))
+        finally:
+            self.close()
+
+    def warm_up(self) -> None:
+        """
+        Connects while waiting for the next input
+        """
+        if not self.context.offline:
+            self.scrap_mgr.session = self.session
+            self.scrap_mgr.warm_up()
+
+    def serve(self, port: int) -> None:
+        with self.connect():
+            ServerMgr(self.scrap_mgr, port=port).serve()
 
     def run_single(self, args: list[str] = None) -> None:
         try:
@@ -71,22 +153,53 @@ class AppMgr:
             msg = e.args[0]
             self.printer.print(msg)
 
+    def run_batch(self, path: str) -> BatchSummary:
+        """
+        Looks up the lines with the modes of the batch's command, without gathering data
+        """
+        base_args = CLI.strip_batch_args(self.input_mgr.last_args)
+        with keep_logging(self.context), self.connect(), BatchMgr.open_lines(path) as lines, BatchMgr.open_output(self.context.output, self.context.resume) as (out, checkpoint):
+            batch_mgr = BatchMgr(ingest=self._ingest_snapshot, scrap=self.scrap_mgr.scrap, parallel=self.context.parallel, langs=self.context.langs, out=out, checkpoint=checkpoint)
+            return batch_mgr.run(lines, base_args)
+
+    def _ingest_snapshot(self, args: list[str]) -> Optional[Context]:
+        """
+        :return: a snapshot of the context for the lookup to run along the next ingestions
+        """
+        return self.context.snapshot() if self._ingest(args) else None
+
     def _raw_run_single(self, args: list[str] = None) -> None:
+        if self._ingest(args):
+            self.run_scrap(self.context.snapshot())
+
+    def _ingest(self, args: list[str] = None) -> bool:
+        """
+        :return: whether there is anything to scrap
+        """
         parsed = self.input_mgr.ingest_input(args)
         if parsed.set or parsed.add or parsed.delete:
             self.context.loop = False
+            self.conf_mgr.valid_data_mgr = self.valid_data_mgr if parsed.delete else None  # Only the deleted langs' entries are touched
             self.conf_mgr.update_conf(parsed)
-            return
+            return False
 
         setup_logging(self.context)
-        if self.context.words:
-            self.run_scrap()
+        self.scrap_mgr.offline = self.context.offline
+        self.scrap_mgr.etymology_depth = self.context.etymology_depth
+        self.scrap_mgr.hedge_percentile = self.context.hedge_percentile if self.context.hedge else None
+        return bool(self.context.words)
 
-    def run_scrap(self) -> None:
+    def run_scrap(self, context: Context) -> None:
+        """
+        :param context: the query's snapshot, unaffected by the next ingestions
+        """
+        printer = self.printer.with_context(context)
         with self.connect():
-            scrap_results = seekable(self.scrap_mgr.scrap(self.context))
-            _.for_each(scrap_results, self.printer.print_result)
+            scrap_results = seekable(self.scrap_mgr.scrap(context))
+            _.for_each(scrap_results, printer.print_result)
 
-        self.conf_mgr.update_lang_order(self.context.all_langs)
+        self.conf_mgr.update_lang_order(context.all_langs)
         scrap_results.seek(0)
-        self.data_gatherer.gather_valid_data(scrap_results, self.input_mgr.processor)
+        outcomes = list(scrap_results)
+        if self.data_gatherer.with_context(context).gather_valid_data(outcomes, self.input_mgr.processor):
+            self.scrap_mgr.mark_gathered(outcomes, context.html_parser)
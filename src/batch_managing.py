@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import shlex
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from src.context import Context
+from src.exceptions import InvalidExecution
+from src.scrapping import Outcome
+from src.scrapping.outcome import MainOutcomeKinds
+
+
+@dataclass
+class BatchSummary:
+    lines: int = 0
+    outcomes: int = 0
+    failed_outcomes: int = 0
+    failed_lines: int = 0
+    skipped_lines: int = 0
+    started_at: float = 0.
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.
+
+    def __str__(self) -> str:
+        return (f'{self.lines} lines, {self.outcomes} outcomes in {self.elapsed:.1f}s ({self.throughput:.2f} lines/s), '
+                f'{self.failed_outcomes} failed outcomes, {self.failed_lines} failed lines'
+                + (f', {self.skipped_lines} lines done before' if self.skipped_lines else ''))
+
+
+@dataclass
+class BatchCheckpoint:
+    """
+    A manifest of the lines done and how far the output got, appended to next to the output after each line.
+    The lines are told by their args, so that the edited ones are looked up again wherever they moved
+    """
+    path: Path
+    done_lines: set[str] = field(default_factory=set)  # Of the previous runs, only loaded to resume
+    done_keys: set[tuple] = field(default_factory=set)  # Of the previous runs, only loaded to resume
+    offset: int = 0
+
+    @classmethod
+    def of(cls, output_path: Path | str) -> BatchCheckpoint:
+        return cls(Path(f'{output_path}.checkpoint'))
+
+    @classmethod
+    def get_line_key(cls, args: list[str]) -> str:
+        return hashlib.sha1(json.dumps(args, ensure_ascii=False).encode()).hexdigest()[:16]
+
+    @classmethod
+    def get_record_key(cls, record: dict) -> tuple:
+        args = record['args']
+        return args.get('from_lang', args.get('lang')), args.get('to_lang'), args['word'], record['kind']
+
+    def load(self) -> BatchCheckpoint:
+        if not self.path.exists():
+            return self
+        with open(self.path, encoding='utf-8') as f:
+            for entry_line in f:
+                try:
+                    entry = json.loads(entry_line)
+                except json.JSONDecodeError:  # Torn by a crash while writing
+                    break
+                if entry['done']:
+                    self.done_lines.add(entry['line'])
+                self.done_keys.update(map(tuple, entry['keys']))
+                self.offset = entry['offset']
+        return self
+
+    def start(self) -> None:
+        self.path.write_text('', encoding='utf-8')
+
+    def save(self, line_key: str, records: list[dict], offset: int) -> None:
+        """
+        A line is done when all of its outcomes are, the successful ones are not written again either way when resuming
+        """
+        keys = [self.get_record_key(record) for record in records if record['ok'] and 'kind' in record]
+        done = bool(records) and all(record['ok'] for record in records)
+        self.offset = offset
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'line': line_key, 'done': done, 'keys': keys, 'offset': offset}, ensure_ascii=False) + '\n')
+
+
+class BatchMgr:
+    """
+    Looks up a word, or a "from to word" triple, per line and streams a JSON record per outcome as soon as the line is done
+    """
+    progress_every: int = 100  # lines, when the progress cannot be rewritten in place
+
+    def __init__(self,
+                 ingest: Callable[[list[str]], Optional[Context]],
+                 scrap: Callable[[Context], Iterable[Outcome]],
+                 parallel: int,
+                 langs: Iterable[str] = (),
+                 out: TextIO = None,
+                 err: TextIO = None,
+                 checkpoint: BatchCheckpoint = None,
+        ):
+        """
+        :param ingest: makes the context of the args' lookup, None if there is nothing to look up
+        """
+        self.ingest = ingest
+        self.scrap = scrap
+        self.parallel = parallel
+        self.langs = set(langs)
+        self.out = out or sys.stdout
+        self.err = err or sys.stderr
+        self.checkpoint = checkpoint
+        self.summary = BatchSummary()
+        self.progress_reported = 0
+
+    @classmethod
+    @contextmanager
+    def open_lines(cls, path: str) -> Iterator[Iterable[str]]:
+        """
+        :param path: "-" for the stdin
+        """
+        if path == '-':
+            yield sys.stdin
+            return
+        with open(path, encoding='utf-8') as f:
+            yield f
+
+    @classmethod
+    @contextmanager
+    def open_output(cls, path: Optional[str], resume: bool = False) -> Iterator[tuple[TextIO, Optional[BatchCheckpoint]]]:
+        """
+        :param path: None for the stdout, which cannot be resumed
+        :param resume: to append after what the checkpoint's lines left, dropping any output written past it
+        """
+        if path is None:
+            if resume:
+                raise InvalidExecution('Cannot resume without an output file!')
+            yield sys.stdout, None
+            return
+        checkpoint = BatchCheckpoint.of(path)
+        if resume and Path(path).exists():
+            checkpoint.load()
+            with open(path, 'r+b') as f:
+                f.truncate(checkpoint.offset)
+        else:
+            checkpoint.start()
+        with open(path, 'a' if resume else 'w', encoding='utf-8') as f:
+            yield f, checkpoint
+
+    def to_args(self, line: str) -> list[str]:
+        match tokens := shlex.split(line):
+            case [from_lang, to_lang, *word] if word and from_lang in self.langs and to_lang in self.langs:
+                return ['--from', from_lang, '--to', to_lang, '--words', ' '.join(word)]
+            case _:
+                return ['--words', ' '.join(tokens)]
+
+    def run(self, lines: Iterable[str], base_args: list[str] = ()) -> BatchSummary:
+        self.summary = BatchSummary(started_at=time.monotonic())
+        self.progress_reported = 0
+        pending: dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self.parallel, thread_name_prefix='batch') as executor:
+            for i, line in enumerate(lines, start=1):
+                if not (line := line.strip()) or line.startswith('#'):
+                    continue
+                args = [*base_args, *self.to_args(line)]
+                if self.checkpoint and (line_key := BatchCheckpoint.get_line_key(args)) in self.checkpoint.done_lines:
+                    self.summary.skipped_lines += 1
+                    continue
+                while len(pending) >= 2 * self.parallel:  # Reading ahead only as much as to keep the workers busy
+                    pending = self._write_done(pending)
+                try:
+                    context = self.ingest(args)
+                except Exception as e:
+                    self._count([self._to_failure(i, line, e)])
+                    continue
+                if context is not None:
+                    pending[executor.submit(self._look_up, i, line, context)] = BatchCheckpoint.get_line_key(args)
+            while pending:
+                pending = self._write_done(pending)
+        self.err.write(f'\n{self.summary}\n' if self.err.isatty() else f'{self.summary}\n')
+        return self.summary
+
+    def _look_up(self, i: int, line: str, context: Context) -> list[dict]:
+        try:
+            outcomes = [outcome for outcome in self.scrap(context) if outcome.kind in MainOutcomeKinds.all()]
+        except Exception as e:
+            return [self._to_failure(i, line, e)]
+        return [{'line': i, 'query': line, **outcome.to_record()} for outcome in outcomes]
+
+    @classmethod
+    def _to_failure(cls, i: int, line: str, e: Exception) -> dict:
+        """
+        The record of a line that could not be looked up at all, unlike a failed outcome it has no kind
+        """
+        return {'line': i, 'query': line, 'ok': False, 'error': str(e.args[0] if e.args else e)}
+
+    def _write_done(self, pending: dict[Future, str]) -> dict[Future, str]:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            self._count(future.result(), pending.pop(future))
+        self._report_progress()
+        return pending
+
+    def _count(self, records: list[dict], line_key: str = None) -> None:
+        self.summary.lines += 1
+        if any('kind' not in record for record in records):
+            self.summary.failed_lines += 1
+        else:
+            self.summary.outcomes += len(records)
+            self.summary.failed_outcomes += sum(not record['ok'] for record in records)
+        for record in records:
+            if not self.checkpoint or not record['ok'] or BatchCheckpoint.get_record_key(record) not in self.checkpoint.done_keys:
+                self._write(record)
+        self.out.flush()
+        if self.checkpoint and line_key is not None:
+            self.checkpoint.save(line_key, records, self.out.tell())
+
+    def _write(self, record: dict) -> None:
+        self.out.write(json.dumps(record, ensure_ascii=False, default=Outcome.to_jsonable) + '\n')
+
+    def _report_progress(self) -> None:
+        if self.err.isatty():
+            self.err.write(f'\r{self.summary}')
+        elif self.summary.lines // self.progress_every != self.progress_reported:
+            self.err.write(f'{self.summary}\n')
+        self.progress_reported = self.summary.lines // self.progress_every
+        self.err.flush()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.constants import Paths
+
+
+CHUNK_SIZE = 1 << 14
+
+
+def main():
+    """
+    Forwards the args to the daemon started with "translate.py --daemon" and streams its output,
+    runs them here if no daemon is listening
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if Paths.DAEMON_SOCKET.lstat().st_uid != os.getuid():
+            raise PermissionError(f'{Paths.DAEMON_SOCKET} belongs to another user')
+        client.connect(str(Paths.DAEMON_SOCKET))
+    except (FileNotFoundError, ConnectionRefusedError, PermissionError):
+        client.close()
+        from src.translate import main as translate
+        return translate()
+    with client:
+        request = {'args': sys.argv[1:], 'color': sys.stdout.isatty() and 'NO_COLOR' not in os.environ}
+        client.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+        try:
+            while chunk := client.recv(CHUNK_SIZE):
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
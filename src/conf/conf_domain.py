@@ -3,7 +3,7 @@ from typing import Literal
 from pydantic import BaseModel, field_validator, ConfigDict, Field, AliasChoices
 
 from src.context_domain import indirect, assume, gather_data, infervia, groupby, ColorSchema, Mappings, UNSET, Color, \
-    retrain_on
+    retrain_on, html_parser, HtmlParser
 
 ConfIndirect = Literal[*(indirect - {'conf'})]
 ConfAssume = Literal[*(assume - {'conf'})]
@@ -25,3 +25,9 @@ class Conf(BaseModel):
     gather_data: ConfGatherData = Field(default=UNSET, alias=AliasChoices('gather-data', 'gather_data'))
     infervia: ConfInferVia = UNSET
     retrain_on: ConfRetrainOn =  Field(default=UNSET, alias=AliasChoices('retrain-on', 'retrain_on', 'train-on', 'train_on'))
+    html_parser: HtmlParser = Field(default=UNSET, alias=AliasChoices('html-parser', 'html_parser'))
+    etymology_depth: int = Field(default=UNSET, alias=AliasChoices('etymology-depth', 'etymology_depth'))
+    parallel: int = UNSET
+    hedge: bool = UNSET
+    hedge_percentile: float = Field(default=UNSET, alias=AliasChoices('hedge-percentile', 'hedge_percentile'))
+    speculative_indirect: bool = Field(default=UNSET, alias=AliasChoices('speculative-indirect', 'speculative_indirect'))
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Type, TypeVar
@@ -20,6 +22,11 @@ class Paths:
     VALID_DATA_FILE = DETECTION_DIR / 'valid_data.csv'
     LANG_SCRIPT_FILE = DETECTION_DIR / 'lang_script.csv'
     MODEL_IO_FILE = DETECTION_DIR / 'model_io.yaml'
+    CACHE_DIR = RESOURCES_DIR / 'cache'
+    RESPONSE_CACHE_DIR = CACHE_DIR / 'responses'
+    RESULT_CACHE_DIR = CACHE_DIR / 'results'
+    CLI_GRAMMAR_FILE = CACHE_DIR / 'cli_grammar.json'
+    DAEMON_SOCKET = Path(os.environ.get('XDG_RUNTIME_DIR') or Path(tempfile.gettempdir()) / f'scraplang-{os.getuid()}') / 'scraplang.sock'  # In the user's runtime dir, or in a dir of their own in the shared tempdir
 
 
 @dataclass(frozen=True)
@@ -27,6 +34,87 @@ class ResourceConstants:
     SHORT_MEMORY_LENGTH = 20
 
 
+@dataclass(frozen=True)
+class ScrapConstants:
+    MAX_WORKERS = 8
+    ETYMOLOGY_DEPTH = 4
+    MAX_ETYMOLOGY_WORKERS = 4
+    MAX_ETYMOLOGY_MEMO_ENTRIES = 256
+    TIMEOUT = (5., 20.)  # connect and read, in seconds
+    POOL_HOSTS = 4
+    POOL_SIZE = 32  # per host, as many as the throttle lets at once
+    STALE_RETRIES = 1  # for the kept-alive connections the host has closed meanwhile
+    BATCH_PARALLELISM = 4  # lines looked up at once
+
+
+@dataclass(frozen=True)
+class ThrottleConstants:
+    INITIAL_RATE = 8.  # requests per second
+    MIN_RATE = .2
+    MAX_RATE = 32.
+    RATE_INCREASE = 1.  # per rate's worth of successes
+    INITIAL_LIMIT = 8.  # concurrent requests
+    MIN_LIMIT = 1.
+    MAX_LIMIT = 32.
+    LIMIT_INCREASE = 1.  # per limit's worth of successes
+    DECREASE = .5
+    BURST = 1.  # seconds worth of tokens
+    BACKOFF = 4.  # tokens worth of waiting without Retry-After
+    MAX_RETRY_AFTER = 60.  # seconds, longer ones fail the request
+    RETRIES = 2
+    POLL_INTERVAL = .05
+    THROTTLING_STATUSES = (429,)
+
+
+@dataclass(frozen=True)
+class HedgeConstants:
+    PERCENTILE = 95.  # of the recent latencies to wait before hedging
+    LATENCY_WINDOW = 100  # recent latencies per host
+    MIN_SAMPLES = 10
+    BUDGET_RATIO = .1  # hedges per request
+    MAX_BUDGET = 5.
+    MAX_WORKERS = 16
+    MAX_REQUEST_WORKERS = 32  # as many as the throttle lets at once, apart from the hedges
+
+
+@dataclass(frozen=True)
+class BreakerConstants:
+    FAILURE_THRESHOLD = 5  # consecutive ones
+    COOL_DOWN = 30.  # seconds before probing again
+
+
+@dataclass(frozen=True)
+class ServerConstants:
+    HOST = '127.0.0.1'
+    WORKERS = 16
+    CLIENT_LIMIT = 4  # requests in flight per client
+    CLIENT_HEADER = 'X-Client'  # to tell the clients apart, the address otherwise
+    RETRY_AFTER = 1  # seconds, when over the client's limit
+    KEEP_ALIVE = 5.  # seconds an idle connection is kept
+
+
+@dataclass(frozen=True)
+class CacheConstants:
+    DAY = 24 * 60 * 60
+    RESPONSE_TTLS = {  # per host, in seconds
+        'glosbe.com': 30 * DAY,
+        'en.wiktionary.org': 7 * DAY,
+    }
+    DEFAULT_RESPONSE_TTL = DAY
+    MAX_RESPONSE_CACHE_SIZE = 256 * 2**20
+    RESULT_TTLS = {  # per outcome kind, in seconds
+        'translation': 30 * DAY,
+        'indirect': 30 * DAY,
+        'inflection': 90 * DAY,
+        'grammar': 90 * DAY,
+        'definition': 30 * DAY,
+        'wiktio': 7 * DAY,
+    }
+    DEFAULT_RESULT_TTL = DAY
+    MAX_RESULT_CACHE_SIZE = 64 * 2**20
+    MAX_MEMORY_RESULTS = 512
+
+
 supported_languages = {
     'af': "afrikaans Afrikaans",
     'sq': "albański Albanian, shqip",
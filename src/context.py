@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from functools import lru_cache
+from dataclasses import dataclass, field, fields, FrozenInstanceError
+from types import MappingProxyType
 from itertools import product, cycle
 from typing import ClassVar, Iterable, Optional, Any, TYPE_CHECKING, Sequence
 
@@ -9,9 +9,9 @@ import pydash as _
 from box import Box
 from pydash import chain as c
 
-from src.constants import preinitialized
+from src.constants import preinitialized, ScrapConstants, HedgeConstants
 from src.context_domain import ColorSchema, Assume, GroupBy, InferVia, GatherData, Indirect, Mappings, UNSET, \
-    Color, color_names, RetrainOn
+    Color, color_names, RetrainOn, HtmlParser
 
 if TYPE_CHECKING:
     from src.conf import Conf
@@ -28,14 +28,26 @@ class Defaults:
 
     debug: bool = False
     test: bool = False
+    offline: bool = False
+    hedge: bool = False
+    hedge_percentile: float = HedgeConstants.PERCENTILE
 
     assume: str = 'lang'
     groupby: str = 'word'
     infervia: str = 'last'
     retrain_on: RetrainOn = 'gather'
     retrain: bool = False
+    html_parser: HtmlParser = 'lxml'
+    etymology_depth: int = ScrapConstants.ETYMOLOGY_DEPTH
+    batch: str = None
+    parallel: int = ScrapConstants.BATCH_PARALLELISM
+    output: str = None
+    resume: bool = False
+    daemon: bool = False
+    serve: int = None
     gather_data: str = 'all'
     indirect: bool = 'fail'
+    speculative_indirect: bool = False
 
     color: Color = field(default_factory=lambda: Box(ColorSchema(
         main=(0, 170, 249),
@@ -49,6 +61,28 @@ class Defaults:
 
 
 
+@dataclass(frozen=True)
+class IterationPlan:
+    """
+    The query's words indexed once, for each lookup by word to take a constant time
+    """
+    bundles: tuple[tuple[str, ...], ...]
+    positions: dict[str, int]  # of the first occurrences, like list.index
+    is_mappeds: tuple[bool, ...]
+
+    @classmethod
+    def of(cls, context: Context) -> IterationPlan:
+        words, n = tuple(context.words), len(context.from_langs)
+        positions = {}
+        for i, word in enumerate(words):
+            positions.setdefault(word, i)
+        return cls(
+            bundles=tuple(words[i:i+n] for i in range(0, len(words), n)) if n else (),
+            positions=positions,
+            is_mappeds=tuple(o != w for o, w in zip(context.unmapped, words)),
+        )
+
+
 class ScrapIterator:
     def __init__(self, context: Context, i: int, from_lang: str, to_lang: str, word: str, prev: ScrapIterator):
         self._context = context
@@ -79,7 +113,6 @@ class ScrapIterator:
     def is_in_same_word_bundle_as_prev(self) -> bool:
         return self.prev_bundle != self.curr_bundle
 
-    @lru_cache()
     def is_in_poly_main_group(self) -> bool:
         if self._context.n_from_langs == 1:
             return len(self._context.words) > 1 and len(self._context.to_langs) > 1
@@ -136,27 +169,21 @@ class ScrapIterator:
     def word_group(self) -> str:
         return '·'.join(self._context.get_from_lang_word_bundle_by_word(self.word))
 
-    @lru_cache()
     def is_last_in_main_group(self) -> bool:
         return self._context.n_all_main_members == 0 or self.i % self._context.n_all_main_members == self._context.n_all_main_members - 1
 
-    @lru_cache()
     def is_at_inflection(self) -> bool:
         return self._context.inflection and self._is_first_in_all_main_members()
 
-    @lru_cache()
     def is_at_grammar(self) -> bool:
         return self._context.grammar and self._is_first_in_all_main_members()
 
-    @lru_cache()
     def is_at_translation(self) -> bool:
         return bool(self.to_lang)
 
-    @lru_cache()
     def is_at_wiktio(self) -> bool:
         return self._context.wiktio and self.is_last_in_main_group()
 
-    @lru_cache()
     def is_at_definition(self) -> bool:
         return self._context.definition and self.is_last_in_main_group
 
@@ -180,66 +207,107 @@ class Context:
 
     debug: bool = UNSET
     test: bool = UNSET
+    offline: bool = UNSET
+    hedge: bool = UNSET
+    hedge_percentile: float = UNSET
 
     assume: Assume = UNSET  # TODO: remove
     groupby: GroupBy = UNSET
     indirect: Indirect = UNSET
+    speculative_indirect: bool = UNSET
     color: Box | Color = UNSET
     gather_data: GatherData = UNSET
     infervia: InferVia = UNSET
     retrain_on: RetrainOn = UNSET
     retrain: bool = UNSET
+    html_parser: HtmlParser = UNSET
+    etymology_depth: int = UNSET
+    batch: str = UNSET
+    parallel: int = UNSET
+    output: str = UNSET
+    resume: bool = UNSET
+    daemon: bool = UNSET
+    serve: int = UNSET
 
     loop: bool = UNSET
 
     mappings: Box | Mappings = UNSET
 
     _to_filter: ClassVar[set[str]] = {'args', 'reverse', 'add', 'delete', 'set', '_', 'orig_from_langs', 'orig_to_langs', 'langs'}
+    _field_names: ClassVar[tuple[str, ...]]
+    _plan_inputs: ClassVar[set[str]] = {'words', 'from_langs', 'unmapped'}
 
+    # The fields' effective values, resolved from the own ones, the conf and the defaults on each assignment,
+    # are plain attributes, so reading them takes no fallback. The rest of the conf is looked up on a miss
     def __init__(self, conf: Conf):
+        object.__setattr__(self, '_own', {})
         self._conf: Conf = conf
+        try:
+            for name in self._field_names:
+                if name != '_conf':
+                    setattr(self, name, getattr(type(self), name))
+        except AttributeError as e:
+            attribute = e.args[0].removeprefix('Attribute "').removesuffix('" not found')
+            raise RuntimeError(f'Default not set for "{attribute}"')
+        self._normalize(self._field_names)
         self.update(**conf.model_dump())
 
+    def snapshot(self) -> ContextSnapshot:
+        """
+        :return: the query's context as it is now, for the query to run along the next ingestions
+        """
+        return ContextSnapshot(self)
+
     def get_only_from_context(self, name: str) -> Any:
-        try:
-            return super().__getattribute__(name)
-        except AttributeError as ar:
-            if ar.args[0] != f"'{Context.__name__}' object has no attribute '{name}'":
-                raise ar
+        return self._own.get(name)
 
-    def __getattribute__(self, name: str) -> Any:
-        try:
-            if (val := super().__getattribute__(name)) is not UNSET:
-                return val
-        except AttributeError as ar:
-            if ar.args[0] != f"'{Context.__name__}' object has no attribute '{name}'":
-                raise ar
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self._resolve(name)
+
+    def _resolve(self, name: str) -> Any:
         if (val := getattr(self._conf, name, UNSET)) is not UNSET:
             return val
         if (val := getattr(Defaults, name, UNSET)) is not UNSET:
             return val
         raise AttributeError(f'Attribute "{name}" not found')
 
+    def __setattr__(self, name: str, val: Any) -> None:
+        if name in self._plan_inputs:
+            vars(self).pop('_plan', None)
+        if name in self._own or name in self._field_names:
+            self._own[name] = val
+            if val is UNSET:
+                val = self._resolve(name)
+        object.__setattr__(self, name, val)
+
     def update(self, **kwargs) -> None:
         kwargs = Box({key: val for key, val in kwargs.items() if key not in self._to_filter})
         if wrong_keys := {key for key in kwargs if not hasattr(self, key)}:
             raise ValueError(f'Context has no such keys: {wrong_keys}')
-        for key, val in kwargs.items():
-            if val is not UNSET:
-                setattr(self, key, val)
-        try:
-            dict_attrs = _.pick_by(asdict(self), lambda val, key: _.is_dict(val) and not key.startswith('_'))
-        except AttributeError as e:
-            attribute = e.args[0].removeprefix('Attribute "').removesuffix('" not found')
-            raise RuntimeError(f'Default not set for "{attribute}"')
-        for key, val in dict_attrs.items():
+        changed = [key for key, val in kwargs.items() if val is not UNSET]
+        for key in changed:
+            setattr(self, key, kwargs[key])
+        self._normalize(changed)
+
+    def _normalize(self, changed: Iterable[str]) -> None:
+        """
+        Completes the changed dicts with the defaults, only they needing to be recomputed
+        """
+        changed = set(changed)
+        for key in changed:
+            if key.startswith('_') or not _.is_dict(val := getattr(self, key)):
+                continue
             unsets = set(_.get(Defaults, key).keys()) - set(val.keys())
             for subkey in unsets:
                 _.set_(self, [key, subkey], _.get(Defaults, [key, subkey]))
             _.set_(self, key, Box(_.get(self, key)))
 
-        self._update_mappings()
-        self._update_color()
+        if 'mappings' in changed:
+            self._update_mappings()
+        if 'color' in changed:
+            self._update_color()
 
     def _update_mappings(self) -> None:
         self.mappings = _.map_values(self.mappings, c().apply_if(lambda d: [d], c().is_dict()))
@@ -257,9 +325,18 @@ class Context:
     def n_from_langs(self) -> int:
         return len(self.from_langs)
 
+    @property
+    def plan(self) -> IterationPlan:
+        """
+        :return: the plan of the current words, made on the first use after they change
+        """
+        if (plan := vars(self).get('_plan')) is None:
+            plan = vars(self)['_plan'] = IterationPlan.of(self)
+        return plan
+
     @property
     def from_lang_word_bundles(self) -> Sequence[Sequence[str]]:
-        return _.chunk(self.words, self.n_from_langs)
+        return self.plan.bundles
 
     @property
     def n_sub_members(self) -> int:
@@ -268,7 +345,7 @@ class Context:
     @property
     def n_all_main_members(self) -> int:  # TODO: Theoritically it's a variable value based on the currect bunddle
         match self.groupby:
-            case 'lang': return self.n_from_langs * (len(list(self.from_lang_word_bundles)) if self.n_from_langs > 1 else 1)
+            case 'lang': return self.n_from_langs * (len(self.from_lang_word_bundles) if self.n_from_langs > 1 else 1)
             case 'word': return self.n_from_langs * len(self.to_langs)
             case _: raise ValueError(f'Unsupported groupby value: {self.groupby}!')
 
@@ -294,13 +371,18 @@ class Context:
     def iterate_args(self) -> Iterable[ScrapIterator]:
         scrap_it = None
         for i, (from_lang, to_lang, word) in enumerate(self.url_triples):
+            if scrap_it is not None:
+                scrap_it.prev = None  # Only the next one looks back, not to keep the whole chain
             scrap_it = ScrapIterator(context=self, i=i, from_lang=from_lang, to_lang=to_lang, word=word, prev=scrap_it)
             yield scrap_it
 
     def get_from_lang_word_bundle_by_word(self, word: str) -> Sequence[str]:
-        n: int = len(self.from_langs)
-        i: int = self.words.index(word) // n
-        return self.words[i*n:(i+1)*n]
+        return self.plan.bundles[self._get_position(word) // len(self.from_langs)]
+
+    def _get_position(self, word: str) -> int:
+        if (i := self.plan.positions.get(word)) is None:
+            raise ValueError(f'"{word}" is not among the words')
+        return i
 
     @property
     def grouparg(self) -> str:
@@ -330,16 +412,40 @@ class Context:
         return self.at.startswith('t')
 
     @property
-    def is_mappeds(self) -> list[bool]:
-        return [o != w for o, w in zip(self.unmapped, self.words)]
+    def is_mappeds(self) -> Sequence[bool]:
+        return self.plan.is_mappeds
 
     def is_mapped(self, word: str) -> bool:
-        try:
-            i = self.words.index(word)
-        except ValueError:
+        if (i := self.plan.positions.get(word)) is None:
             return False
         return self.is_mappeds[i]
 
     def get_unmmapped(self, word: str) -> str:
-        i = self.words.index(word)
-        return self.unmapped[i]
+        return self.unmapped[self._get_position(word)]
+
+
+class ContextSnapshot(Context):
+    """
+    A context resolved from the args, the conf and the defaults at once and frozen, so that it can be shared between threads
+    """
+    def __init__(self, context: Context):
+        names = {*self._field_names, *type(context._conf).model_fields}
+        for name in names:
+            object.__setattr__(self, name, self._freeze(getattr(context, name)))
+        object.__setattr__(self, '_own', MappingProxyType({name: self._freeze(val) for name, val in context._own.items()}))
+
+    @classmethod
+    def _freeze(cls, val: Any) -> Any:
+        match val:
+            case dict(): return Box(val, frozen_box=True)
+            case list(): return tuple(val)
+            case _: return val
+
+    def __setattr__(self, name: str, val: Any) -> None:
+        raise FrozenInstanceError(f'Cannot assign to "{name}" of a context snapshot')
+
+    def snapshot(self) -> ContextSnapshot:
+        return self
+
+
+Context._field_names = tuple(context_field.name for context_field in fields(Context))
@@ -11,6 +11,7 @@ infervia = {'all', 'ai', 'time', 'last', 'off', 'conf'}
 retrain_on = {'gather', 'flag'}
 groupby = {'lang', 'word', 'conf'}
 at = {'from', 'to', 'f', 't', 'none'}
+html_parser = {'lxml', 'html5lib', 'html.parser'}
 
 
 Indirect = Literal[*indirect]
@@ -21,6 +22,7 @@ RetrainOn = Literal[*retrain_on]
 GroupBy = Literal[*groupby]
 Mappings = dict[str, list[dict[str, str]] | dict[str, str]]
 At = Literal[*at]
+HtmlParser = Literal[*html_parser]
 
 color_names = {'main', 'pronunciation'}
 ColorNames = Literal[*color_names]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from socketserver import StreamRequestHandler, UnixStreamServer
+from typing import TYPE_CHECKING, Iterator
+
+from src.constants import Paths
+from src.exceptions import InvalidExecution
+from src.logutils import setup_logging
+
+if TYPE_CHECKING:
+    from src.app_managing import AppMgr
+
+
+class DaemonMgr:
+    """
+    Keeps the app resident and runs the client's args one at a time, streaming what it prints back to the client.
+    The context carries over between the requests like between the loop's inputs
+    """
+    def __init__(self, app_mgr: AppMgr, socket_path: Path | str = Paths.DAEMON_SOCKET):
+        self.app_mgr = app_mgr
+        self.socket_path = Path(socket_path)
+
+    @classmethod
+    def is_running(cls, socket_path: Path | str = Paths.DAEMON_SOCKET) -> bool:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                if not cls.is_owned(Path(socket_path)):
+                    return False
+                probe.connect(str(socket_path))
+            except (FileNotFoundError, ConnectionRefusedError, PermissionError):
+                return False
+        return True
+
+    @classmethod
+    def is_owned(cls, path: Path) -> bool:
+        """
+        Tells the user's files apart from the ones another user may have put in their place, not to be connected to or removed
+        """
+        return path.lstat().st_uid == os.getuid()
+
+    def serve(self) -> None:
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not self.is_owned(self.socket_path.parent):
+            raise InvalidExecution(f'{self.socket_path.parent} belongs to another user!')
+        if self.is_running(self.socket_path):
+            raise InvalidExecution(f'A daemon is already listening on {self.socket_path}!')
+        if os.path.lexists(self.socket_path) and not self.is_owned(self.socket_path):
+            raise InvalidExecution(f'{self.socket_path} belongs to another user!')
+        self.socket_path.unlink(missing_ok=True)  # Left by a daemon that was killed
+        daemon_mgr = self
+
+        class Handler(StreamRequestHandler):
+            def handle(self) -> None:
+                daemon_mgr.handle(self.rfile.readline(), self.connection)
+
+        with self._owner_only():  # Bound accessible to the owner only, leaving no moment for others to connect
+            server = UnixStreamServer(str(self.socket_path), Handler)
+        with server:  # Serving one request at a time, as the app is not thread-safe
+            logging.info(f'Listening on {self.socket_path}')
+            self.app_mgr.warm_up()
+            try:
+                server.serve_forever()
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+
+    @classmethod
+    @contextmanager
+    def _owner_only(cls) -> Iterator[None]:
+        """
+        Makes the files created meanwhile accessible to the owner only from the start
+        """
+        umask = os.umask(0o177)
+        try:
+            yield
+        finally:
+            os.umask(umask)
+
+    def handle(self, request_line: bytes, connection: socket.socket) -> None:
+        """
+        :param request_line: the JSON of the client's args and whether its terminal takes colors
+        """
+        try:
+            request = json.loads(request_line)
+        except json.JSONDecodeError:
+            logging.debug(f'Dropping a malformed request: {request_line[:100]!r}')
+            return
+        with io.TextIOWrapper(connection.makefile('wb'), encoding='utf-8', line_buffering=True, write_through=True) as out:
+            self.app_mgr.printer.force_color = request.get('color')
+            try:
+                with redirect_stdout(out), redirect_stderr(out):
+                    self.app_mgr.run_single(request['args'])
+            except SystemExit:  # Exited by the args' parsing, its message already sent
+                pass
+            except BrokenPipeError:
+                logging.debug('The client left before the output was sent')
+            except Exception as e:
+                logging.exception(e)
+            finally:
+                self.app_mgr.printer.force_color = None
+                setup_logging(self.app_mgr.context)  # Back from the client's stream
+                self.app_mgr.warm_up()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
 from argparse import ArgumentParser, Namespace, SUPPRESS, Action
+from functools import cache
+from hashlib import sha256
 from itertools import permutations, product, combinations, chain
+from pathlib import Path
 from typing import Iterable
 
 import pydash as _
@@ -13,7 +17,8 @@ from more_itertools import flatten
 from ordered_set import OrderedSet
 from pydash import chain as c
 
-from src.conf import indirect, gather_data, infervia, groupby
+from src.constants import Paths
+from src.conf import indirect, gather_data, infervia, groupby, html_parser
 from src.context import Context
 from src.context_domain import UNSET, assume, at
 from src.logutils import setup_logging
@@ -31,7 +36,28 @@ class AtSpecifierAction(Action):
                     yield ''.join(perm)
 
     @classmethod
-    def side_mode_fusions(cls) -> Iterable[str]:
+    @cache
+    def side_mode_fusions(cls) -> list[str]:
+        """
+        :return: the options, as generated on the first run of this source and then read from the disk
+        """
+        source_key = sha256(Path(__file__).read_bytes()).hexdigest()
+        try:
+            grammar = json.loads(Paths.CLI_GRAMMAR_FILE.read_text())
+            if grammar['source'] == source_key:
+                return grammar['fusions']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        fusions = cls._generate_side_mode_fusions()
+        try:
+            Paths.CLI_GRAMMAR_FILE.parent.mkdir(parents=True, exist_ok=True)
+            Paths.CLI_GRAMMAR_FILE.write_text(json.dumps({'source': source_key, 'fusions': fusions}))
+        except OSError as e:
+            logging.debug(f'Could not save the CLI grammar: {e}')
+        return fusions
+
+    @classmethod
+    def _generate_side_mode_fusions(cls) -> list[str]:
         conflicting_like = {'to',}  #{f'{s}{m}' for m in cls.modes for s in cls.sides}
         perms = chain(
             cls.mode_permutations(),
@@ -65,22 +91,38 @@ class AtSpecifierAction(Action):
 
 
 class CLI:
+    batch_options = ('--batch',)
+    parallel_options = ('--parallel', '-P')
+    output_options = ('--output', '-O')
+    resume_options = ('--resume',)
+
     def __init__(self, context: Context):
         self.context = context
         self._direct_arg = re.compile(r"^-[A-Za-z]\d")
 
     @property
     def parser(self) -> ArgumentParser:
+        return self._build_parser()
+
+    @classmethod
+    @cache
+    def _build_parser(cls) -> ArgumentParser:  # Built once, as it does not depend on the context
         parser = ArgumentParser(
             prog='ScrapLang',
             description='Language Scrapping Program',
             epilog=''
         )
-        parser = _.flow(self._add_base_args, self._add_execution_mode_args, self._add_setting_mode_args, self._add_loop_control_args)(parser)
+        parser = _.flow(cls._add_base_args, cls._add_execution_mode_args, cls._add_setting_mode_args, cls._add_loop_control_args)(parser)
 
         return parser
 
-    def _add_base_args(self, parser: ArgumentParser) -> ArgumentParser:
+    @classmethod
+    @cache
+    def _get_defaults(cls) -> Namespace:
+        return cls._build_parser().parse_known_args([])[0]
+
+    @classmethod
+    def _add_base_args(cls, parser: ArgumentParser) -> ArgumentParser:
         base_group = parser.add_argument_group(title='Base Arguments')
         base_group.add_argument('args', nargs='*', help='Words to translate, language to translate from and languages to translate to')
         base_group.add_argument('--words', '-words', '-words', '-word', '-w', nargs='+', default=[], help='Words to translate')
@@ -89,7 +131,8 @@ class CLI:
         base_group.add_argument('--langs', '--lang', '-langs', '-lang', '-l', dest='langs', nargs='+', default=[], help=lang_help)
         return parser
 
-    def _add_execution_mode_args(self, parser: ArgumentParser) -> ArgumentParser:
+    @classmethod
+    def _add_execution_mode_args(cls, parser: ArgumentParser) -> ArgumentParser:
         # Translation Modes
         translation_mode_group = parser.add_argument_group(title='Translation Modes')
 
@@ -100,6 +143,8 @@ class CLI:
         translation_mode_group.add_argument('--grammar', '-grammar', '-g', action='store_true', default=False, help='Show grammar info')
         translation_mode_group.add_argument('--definition', '--definitions', '-definition', '-definitions', '--def', '-def', '-d', action='store_true', default=False, help='Show word definitions')
         translation_mode_group.add_argument('--indirect', choices=indirect, default=UNSET, help='Turn on indirect translation')
+        translation_mode_group.add_argument('--speculative-indirect', action='store_true', default=UNSET, help='With "--indirect fail", look the indirect translation up along the main one')
+        translation_mode_group.add_argument('--etymology-depth', type=int, default=UNSET, help='How many further pages to follow an etymology through')
         # CLI Reasoning Modes
         cli_reasoning_group = parser.add_argument_group(title='CLI Reasoning Modes')
         cli_reasoning_group.add_argument('--reverse', '--reversed', '-r', action='store_true', help='Reverse the from_lang(s) with the first to_lang')
@@ -110,39 +155,98 @@ class CLI:
         # Display Modes
         display_group = parser.add_argument_group(title='Display Modes')
         display_group.add_argument('--groupby', '-by', choices=groupby, default=UNSET, help='What to group the result translations by')
+        # Network Modes
+        network_group = parser.add_argument_group(title='Network Modes')
+        network_group.add_argument('--offline', '--cache-only', action='store_true', default=False, help='Answer only from the cached pages')
+        network_group.add_argument('--html-parser', choices=html_parser, default=UNSET, help='What to parse the pages with')
+        network_group.add_argument('--hedge', action='store_true', default=UNSET, help='Send a duplicate of a request slower than most of the recent ones')
+        network_group.add_argument('--hedge-percentile', type=float, default=UNSET, help='The percentile of the recent latencies to wait before hedging')
+        # Batch Modes
+        batch_group = parser.add_argument_group(title='Batch Modes')
+        batch_group.add_argument(*cls.batch_options, default=None, metavar='PATH', help='Look up a word or a "from to word" triple per line of the file ("-" for stdin), printing a JSON record per result')
+        batch_group.add_argument(*cls.parallel_options, type=int, default=UNSET, help='How many lines to look up at once')
+        batch_group.add_argument(*cls.output_options, default=None, metavar='PATH', help='Write the records to the file, checkpointing each line next to it')
+        batch_group.add_argument(*cls.resume_options, action='store_true', default=False, help='Skip the lines done in the previous run and append to its output')
+        # Daemon Modes
+        daemon_group = parser.add_argument_group(title='Daemon Modes')
+        daemon_group.add_argument('--daemon', action='store_true', default=False, help='Stay resident and serve the lookups of the client over a Unix socket')
+        daemon_group.add_argument('--serve', type=int, default=None, metavar='PORT', help='Serve the lookups as a JSON API over HTTP on the port of the localhost')
         # Developer Modes (groupless)
         parser.add_argument('--debug', action='store_true', help=SUPPRESS)
         parser.add_argument('--test', action='store_true', help=SUPPRESS)
         return parser
 
     # TODO: add and think through the settings displayal mode
-    def _add_setting_mode_args(self, parser: ArgumentParser) -> ArgumentParser:
+    @classmethod
+    def _add_setting_mode_args(cls, parser: ArgumentParser) -> ArgumentParser:
         setting_group = parser.add_argument_group(title='Setting')
         setting_group.add_argument('--set', '-set', '-s', action='append', nargs='+', default=[])
         setting_group.add_argument('--add', '-add', '-a', action='append', nargs='+', default=[])
         setting_group.add_argument('--delete', '-delete', '--del', '-del', action='append', nargs='+', default=[])
         return parser
 
-    def _add_loop_control_args(self, parser: ArgumentParser) -> ArgumentParser:
+    @classmethod
+    def _add_loop_control_args(cls, parser: ArgumentParser) -> ArgumentParser:
         loop_control_group = parser.add_argument_group(title='Loop Control')
         loop_control_exclusive = loop_control_group.add_mutually_exclusive_group()
         loop_control_exclusive.add_argument('--loop', '-loop', action='store_true', default=UNSET, help='Enter a translation loop')
         loop_control_exclusive.add_argument('--exit', '-exit', action='store_false', default=UNSET, dest='loop', help='Exit loop')
         return parser
 
+    @classmethod
+    def strip_batch_args(cls, args: list[str]) -> list[str]:
+        """
+        :return: the args to apply to each of the batch's lines
+        """
+        stripped, args_it = [], iter(args)
+        for arg in args_it:
+            option, is_joined, _value = arg.partition('=')
+            if option in cls.batch_options + cls.parallel_options + cls.output_options:
+                if not is_joined:
+                    next(args_it, None)
+                continue
+            if option in cls.resume_options:
+                continue
+            stripped.append(arg)
+        return stripped
+
     def parse(self, args: list[str]) -> Namespace:
         if not args:
             self.parser.print_help()
             exit(0)  # change
 
-        parsed, remaining = self.parser.parse_known_args(args)
-        parsed.args += _.reject(remaining, '--'.__eq__)  # make test for this fix: t ksiądz -i pl
+        parsed = self._parse_positionals(args) or self._parse_all(args)
         setup_logging(parsed)
         self.context.update(**{**vars(parsed), 'words': UNSET, 'from_langs': UNSET, 'to_langs': UNSET}); logging.debug('Updating context in CLI')
         parsed = self._distribute_args(parsed)
         logging.debug(f'base Parsed: {parsed}')
         return parsed
 
+    @classmethod
+    def _parse_positionals(cls, args: list[str]) -> Namespace | None:
+        """
+        :return: the parsed plain "[from] [to] words…" form, as argparse would parse it, or None for any option
+        """
+        if any(arg.startswith('-') for arg in args):
+            return None
+        return cls._detach(Namespace(**{**vars(cls._get_defaults()), 'args': list(args)}))
+
+    @classmethod
+    def _parse_all(cls, args: list[str]) -> Namespace:
+        parsed, remaining = cls._build_parser().parse_known_args(args)
+        parsed.args += _.reject(remaining, '--'.__eq__)  # make test for this fix: t ksiądz -i pl
+        return cls._detach(parsed)
+
+    @classmethod
+    def _detach(cls, parsed: Namespace) -> Namespace:
+        """
+        Copies the lists, as the defaults are shared by the parses and later extended in place
+        """
+        for key, val in vars(parsed).items():
+            if isinstance(val, list):
+                setattr(parsed, key, list(val))
+        return parsed
+
     def _distribute_args(self, parsed: Namespace) -> Namespace:
         if parsed.langs and not parsed.from_langs:  # TODO: test both the following ifs
             parsed.from_langs = [parsed.langs.pop(0)]
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import logging
 from argparse import Namespace
+from copy import copy
 from pathlib import Path
 from typing import Iterable
 
@@ -24,12 +27,28 @@ class DataGatherer:
         self.valid_args_mgr = valid_data_mgr
         self.shor_mem_mgr = ShortMemMgr(short_mem_file, length=ResourceConstants.SHORT_MEMORY_LENGTH) if short_mem_file else None
 
-    def gather_valid_data(self, scrap_results: Iterable[Outcome], processor: InputProcessor) -> None:
-        if self.valid_args_mgr and self.context.gather_data in ['all', 'ai']:
-            gathered = self.valid_args_mgr.gather(scrap_results)
+    def with_context(self, context: Context) -> DataGatherer:
+        """
+        :return: a gatherer of the query's context, sharing the resources with this one
+        """
+        data_gatherer = copy(self)
+        data_gatherer.context = context
+        data_gatherer.valid_args_mgr = self.valid_args_mgr and self.valid_args_mgr.with_context(context)
+        return data_gatherer
+
+    def gather_valid_data(self, scrap_results: Iterable[Outcome], processor: InputProcessor) -> bool:
+        """
+        Gathers only from the outcomes not gathered before, sparing loading the valid data when there are none
+        :return: whether the outcomes are gathered by now
+        """
+        if not self.valid_args_mgr or self.context.gather_data not in ['all', 'ai']:
+            return False
+        if new_results := [outcome for outcome in scrap_results if not outcome.gathered]:
+            gathered = self.valid_args_mgr.gather(new_results)
             if gathered:  # TODO: test
                 logging.debug('Retraining after having data gathered')
                 self.data_processor.generate_script_summary()
+        return True
 
     def gather_short_mem(self, parsed: Namespace) -> None:
         if self.shor_mem_mgr and self.context.gather_data in ['all', 'time']:
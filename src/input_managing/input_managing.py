@@ -21,17 +21,18 @@ class InputMgr:
         self.context = context
         self.cli = CLI(context)
         self.processor = InputProcessor(context, data_processor=data_processor)
+        self.last_args: list[str] = []
 
 
     def ingest_input(self, args: list[str] | str = None):
         args = _.apply_if(args, shlex.split, _.is_string) or sys.argv[1:]
-        args = _.flat_map(args, c().split('\xa0'))
+        args = self.last_args = _.flat_map(args, c().split('\xa0'))
         parsed = self.cli.parse(args)
         if parsed.retrain is True:  # TODO: test flag with(out) exiting
             self.processor.retrain_detector()
             if not parsed.words:
                 logging.debug('No words for scrapping, exiting after analysis')
-        elif parsed.set or parsed.add or parsed.delete or isinstance(parsed.loop, bool):
+        elif parsed.set or parsed.add or parsed.delete or isinstance(parsed.loop, bool) or parsed.batch or parsed.daemon or parsed.serve is not None:
             pass
         elif self.context.loop is True and parsed.reverse:
             pass
@@ -3,7 +3,7 @@ import logging
 import re
 from argparse import Namespace
 from collections.abc import Callable
-from functools import reduce
+from functools import cached_property, reduce
 from itertools import cycle
 from typing import Optional
 
@@ -25,7 +25,13 @@ class InputProcessor:
         self.context = context
         self.outstemmer = Outstemmer()
         self.data_processor = data_processor
-        self.detector = Detector(self.data_processor.lang_script, valid_data_mgr=self.data_processor.valid_data_mgr) if self.data_processor.lang_script_mgr else None
+
+    @cached_property
+    def detector(self) -> Optional[Detector]:
+        """
+        Loads the lang script only once inferring needs it
+        """
+        return Detector(self.data_processor.lang_script, valid_data_mgr=self.data_processor.valid_data_mgr) if self.data_processor.lang_script_mgr else None
 
     def process(self, parsed: Namespace) -> Namespace:
         parsed = self._word_outstemming(parsed)
@@ -95,7 +101,7 @@ class InputProcessor:
             return 'From lang explicitly specified, not inferring'
         if parsed.reverse:  # TODO: add test for reversing!
             return 'Last used langs should be reversed, not inferring'
-        if not self.detector or self.context.infervia not in {'all', 'ai'}:
+        if self.context.infervia not in {'all', 'ai'} or not self.detector:
             return 'AI Inferring disabled, not inferring'
         return None
 
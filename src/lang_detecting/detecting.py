@@ -1,35 +1,38 @@
-import ast
-import operator as op
-from functools import reduce
-from typing import Sequence, Optional
+from __future__ import annotations
 
-from GlotScript import sp
-from pandas import DataFrame
+import operator as op
+from functools import cached_property, reduce
+from importlib.util import find_spec
+from typing import Sequence, Optional, TYPE_CHECKING
 
-from src.lang_detecting.advanced_detecting.conf import Conf
-from src.lang_detecting.preprocessing.data import LSC
 from src.lang_detecting.simple_detecting import SimpleDetector
 from src.resouce_managing.valid_data import ValidDataMgr
 
-try:
-    import torch
-    HAS_LIB_TORCH = True
-except ImportError:
-    HAS_LIB_TORCH = False
+HAS_LIB_TORCH = find_spec('torch') is not None  # Imported only once the advanced detector is needed
 
-if HAS_LIB_TORCH:
+if TYPE_CHECKING:
+    from pandas import DataFrame
     from src.lang_detecting.advanced_detecting.advanced_detector import AdvancedDetector
 
 
 class Detector:
     def __init__(self, lang_script: DataFrame, valid_data_mgr: ValidDataMgr):
         self.lang_script = lang_script
+        self.valid_data_mgr = valid_data_mgr
         self.simple_detector = SimpleDetector(self.lang_script) if lang_script is not None else None
-        self.advanced_detector = AdvancedDetector(self.lang_script, valid_data_mgr=valid_data_mgr, conf=Conf()) if HAS_LIB_TORCH and lang_script is not None else None
+
+    @cached_property
+    def advanced_detector(self) -> Optional[AdvancedDetector]:
+        if not HAS_LIB_TORCH or self.lang_script is None:
+            return None
+        from src.lang_detecting.advanced_detecting.advanced_detector import AdvancedDetector
+        from src.lang_detecting.advanced_detecting.conf import Conf
+        return AdvancedDetector(self.lang_script, valid_data_mgr=self.valid_data_mgr, conf=Conf())
 
     def detect_simple(self, words: Sequence[str]) -> Optional[str]:
         if not self.simple_detector:
             return None
+        from GlotScript import sp
         if not (pot_scripts := sp(''.join(words))[-1]['details']):
             return None
         scripts = set(pot_scripts)
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 import ast
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 
-from GlotScript import sp
-from pandas import DataFrame
 from pydash import chain as c
 from pydash import flow
 
@@ -12,6 +14,9 @@ from src.constants import preinitialized
 from src.resouce_managing.file import FileMgr
 from src.resouce_managing.valid_data import VDC, ValidDataMgr
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 @preinitialized
 @dataclass
@@ -33,7 +38,11 @@ def adjust_lang_script(lang_script: DataFrame) -> DataFrame:
 class DataProcessor:
     def __init__(self, *, valid_data_mgr: ValidDataMgr, lang_script_file: Path | str):
         self.valid_data_mgr: ValidDataMgr = valid_data_mgr
-        self.lang_script_mgr = FileMgr(lang_script_file, create_if_not=True, func=adjust_lang_script) if lang_script_file else None
+        self.lang_script_file = lang_script_file
+
+    @cached_property
+    def lang_script_mgr(self) -> Optional[FileMgr]:
+        return FileMgr(self.lang_script_file, create_if_not=True, func=adjust_lang_script) if self.lang_script_file else None
 
     @property
     def lang_script(self) -> DataFrame:
@@ -45,6 +54,7 @@ class DataProcessor:
         :param data: [lang: str, word: str]
         :return:
         """
+        from GlotScript import sp
         lang_script = data[~data[VDC.IS_MAPPED]].groupby(VDC.LANG)[VDC.WORD].apply(flow(''.join, set, c().flat_map(lambda c: [c, c.upper()]), set, sorted, ''.join)).reset_index()
         lang_script.rename(columns={VDC.WORD: LSC.CHARS, VDC.LANG: LSC.LANG}, inplace=True)
         lang_script[LSC.SCRIPTS] = lang_script[LSC.CHARS].apply(lambda w: set(sp(''.join(w))[-1]['details'].keys()))
@@ -1,9 +1,12 @@
-from typing import Optional
+from __future__ import annotations
 
-from pandas import DataFrame
+from typing import Optional, TYPE_CHECKING
 
 from src.lang_detecting.preprocessing.data import LangScriptColumns as C
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 class SimpleDetector:
     def __init__(self, lang_script: DataFrame):
@@ -2,7 +2,9 @@ import logging
 import sys
 import warnings
 from argparse import Namespace
+from contextlib import contextmanager
 from dataclasses import asdict
+from typing import Iterator
 
 from box import Box
 
@@ -19,7 +21,26 @@ def adjust_dict_like_obj(obj: Context | Namespace) -> Box:
     return Box(context, default_box=True)
 
 
+_is_kept = False
+
+
+@contextmanager
+def keep_logging(context: Context | Namespace) -> Iterator[None]:
+    """
+    Sets the logging up for a run of many ingestions, e.g. the batch's, none of which may set it up again meanwhile
+    """
+    global _is_kept
+    setup_logging(context)
+    _is_kept = True
+    try:
+        yield
+    finally:
+        _is_kept = False
+
+
 def setup_logging(context: Context | Namespace = None) -> None:
+    if _is_kept:
+        return
     root_logger = logging.getLogger()
     context = adjust_dict_like_obj(context)
 
@@ -28,7 +49,7 @@ def setup_logging(context: Context | Namespace = None) -> None:
         handler.close()
         root_logger.removeHandler(handler)
     # 2. Set fresh handlers
-    handlers = [logging.StreamHandler(sys.stdout)]
+    handlers = [logging.StreamHandler(sys.stderr if context.batch else sys.stdout)]  # Keeping the batch's records apart
     if context.debug:
         handlers.append(logging.FileHandler(Paths.LOG_DIR, encoding='utf-8'))
     # 3. Configure with current debug state
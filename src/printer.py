@@ -1,20 +1,26 @@
+from __future__ import annotations
+
 import os
 import traceback
+from copy import copy
 from dataclasses import dataclass
 from textwrap import indent, wrap
-from typing import Any, Callable
+from functools import cached_property
+from typing import Any, Callable, TYPE_CHECKING
 
 import pydash as _
-from apscheduler.schedulers.blocking import BlockingScheduler
-from pandas import DataFrame
 from pydash import chain as c, partial
-from tabulate import tabulate
 from termcolor import colored
 
 from .context import Context
 from .scrapping import Outcome, OutcomeKinds as OK
+from .scrapping.outcome import is_data_frame
 from .scrapping.wiktio.parsing import Meaning, Pronunciation, WiktioResult
 
+if TYPE_CHECKING:
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from pandas import DataFrame
+
 os.environ['TZ'] = 'Europe/Warsaw'
 
 @dataclass(frozen=True)
@@ -27,9 +33,22 @@ class Colors:  # TODO: enable conf setting and a flag for no color
 class Printer:
     def __init__(self, context: Context, printer: Callable[[Any], None] = None, interval: int = 0):
         self.interval = interval
-        self.scheduler = BlockingScheduler()
         self._printer = printer or print
         self.context = context
+        self.force_color: bool = None  # None to tell by the stdout
+
+    @cached_property
+    def scheduler(self) -> BlockingScheduler:
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        return BlockingScheduler()
+
+    def with_context(self, context: Context) -> Printer:
+        """
+        :return: a printer of the query's context, leaving this one's intact
+        """
+        printer = copy(self)
+        printer.context = context
+        return printer
 
     def print(self, *args, color=None, **kwargs) -> None:
         args = _.map_(args, partial(self.color, color=color))
@@ -66,7 +85,8 @@ class Printer:
     def color(self, to_color, color: str | tuple[int, int, int]) -> str:
         if not color:
             return to_color
-        return colored(to_color, tuple(color) if not isinstance(color, str) else color)
+        force = {} if self.force_color is None else {'force_color': self.force_color, 'no_color': not self.force_color}
+        return colored(to_color, tuple(color) if not isinstance(color, str) else color, **force)
 
     def print_separator(self, group: str, sep: str) -> None:
         bias = len(group)
@@ -78,11 +98,12 @@ class Printer:
             self.print(outcome.results.args[0])
             return
         match outcome.results:
-            case DataFrame() as table: self.print_inflection_table(table)
+            case table if is_data_frame(table): self.print_inflection_table(table)
             case list(): self.print_grammar(outcome)
             case _: raise ValueError(f'Unexpected result type for inflection: {type(outcome.results)}')
 
     def print_inflection_table(self, table: DataFrame) -> None:
+        from tabulate import tabulate
         table_str = tabulate(table, tablefmt='rounded_outline')
         if (olen := len(table_str.split('\n', 1)[0])) > 128:
             table = table.map(lambda x: "\n".join(wrap(x, width=16)))
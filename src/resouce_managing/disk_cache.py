@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from typing import Optional
+
+
+class DiskCache:
+    """
+    Compressed key-value store of bytes with expiration and size-bounded LRU eviction.
+    The modification time of an entry is its write time, the access time is its last use.
+    The last-use order is read from the disk once, then kept in memory.
+    """
+    suffix: str = '.gz'
+
+    def __init__(self, directory: Path | str, max_size: int):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._lock = RLock()
+        self._sizes: Optional[OrderedDict[Path, int]] = None  # From the least to the most recently used
+        self._total = 0
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f'{sha256(key.encode()).hexdigest()}{self.suffix}'
+
+    @property
+    def sizes(self) -> OrderedDict[Path, int]:
+        if self._sizes is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stats = {path: path.stat() for path in self.directory.glob(f'*{self.suffix}')}
+            self._sizes = OrderedDict((path, stat.st_size) for path, stat in sorted(stats.items(), key=lambda item: item[1].st_atime))
+            self._total = sum(self._sizes.values())
+        return self._sizes
+
+    def _use(self, path: Path, size: int) -> None:
+        sizes = self.sizes
+        self._total += size - sizes.get(path, 0)
+        sizes[path] = size
+        sizes.move_to_end(path)
+
+    def get(self, key: str, ttl: float = None) -> Optional[bytes]:
+        path = self._get_path(key)
+        with self._lock:
+            try:
+                stat = path.stat()
+                if ttl is not None and time.time() - stat.st_mtime > ttl:
+                    logging.debug(f'Cache entry expired: {key}')
+                    self._remove(path)
+                    return None
+                with open(path, 'rb') as f:
+                    content = gzip.decompress(f.read())
+                os.utime(path, (time.time(), stat.st_mtime))
+                self._use(path, stat.st_size)
+            except FileNotFoundError:
+                return None
+            except (OSError, EOFError) as e:
+                logging.debug(f'Dropping unreadable cache entry {path}: {e}')
+                self._remove(path)
+                return None
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        path = self._get_path(key)
+        compressed = gzip.compress(content)
+        with self._lock:
+            self.sizes  # Indexes the entries and makes the directory on the first use
+            with NamedTemporaryFile(dir=self.directory, prefix='.', suffix='.tmp', delete=False) as tmp:
+                tmp.write(compressed)
+            os.replace(tmp.name, path)
+            self._use(path, len(compressed))
+            self._evict()
+
+    def _remove(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        if self._sizes is not None:
+            self._total -= self._sizes.pop(path, 0)
+
+    def _evict(self) -> None:
+        if self._total <= self.max_size:
+            return
+        while self._total > self.max_size and self.sizes:
+            self._remove(next(iter(self.sizes)))
+        logging.debug(f'Evicted cache entries down to {self._total}B in {self.directory}')
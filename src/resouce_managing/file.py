@@ -3,16 +3,16 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, TYPE_CHECKING
 
-import pandas as pd
 import pydash as _
 import yaml
 from box import Box
-from pandas import DataFrame
-from pandas.errors import EmptyDataError
 from pydantic import BaseModel, RootModel
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 UNSET = object()
 
 
@@ -90,6 +90,8 @@ class FileMgr:
 
     @classmethod
     def load_csv(cls, path: str | Path) -> Optional[DataFrame]:
+        import pandas as pd
+        from pandas.errors import EmptyDataError
         try:
             return pd.read_csv(path)
         except EmptyDataError:
@@ -1,14 +1,13 @@
+from __future__ import annotations
+
 import logging
+from copy import copy
 from dataclasses import replace, dataclass, asdict
 from pathlib import Path
-from typing import Iterable, Sequence, Callable, Collection, Sized
+from typing import Iterable, Sequence, Callable, Collection, Sized, TYPE_CHECKING
 
-import pandas as pd
 import pydash as _
-from GlotScript import sp
 from box import Box
-from pandas import DataFrame
-from pandas.core.groupby import DataFrameGroupBy
 from pydantic import BaseModel, field_validator, ConfigDict
 from pydash import chain as c
 
@@ -19,6 +18,10 @@ from ..context import Context
 from ..scrapping import Outcome, MainOutcomeKinds as Kinds
 from ..scrapping.wiktio.parsing import WiktioResult
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pandas.core.groupby import DataFrameGroupBy
+
 
 @preinitialized
 @dataclass
@@ -57,15 +60,22 @@ class ValidDataMgr:
         self.valid_data_file_mgr = FileMgr(conf_file)
         self._n_parsed: int = n_parsed
 
+    def with_context(self, context: Context) -> ValidDataMgr:
+        valid_data_mgr = copy(self)
+        valid_data_mgr.context = context
+        return valid_data_mgr
+
     @property
     def data(self) -> DataFrame:
         return self.valid_data_file_mgr.content
 
     def gather(self, scrap_results: Iterable[Outcome]) -> bool:
         logging.debug('Searching something not-yet-gathered')
+        import pandas as pd
+        from GlotScript import sp
         success_results = [replace(sr, args=Box(sr.args, default_box=True)) for sr in scrap_results if sr.is_success()]
         cols = list(asdict(ValidDataColumns).values())
-        success_data = DataFrame(c(success_results).apply(_.over([
+        success_data = pd.DataFrame(c(success_results).apply(_.over([
                 self._gather_for_from_main_translations,
                 self._gather_for_lang_data,
                 self._gather_for_wiktio,
@@ -84,6 +94,7 @@ class ValidDataMgr:
         return False
 
     def is_arg_set_valid(self, kinds: Collection[str], lang_arg: str) -> Callable[[Outcome], bool]:
+        from pandas import DataFrame
         return lambda o: _.over_every([
             c().get('kind').apply(kinds.__contains__),
             c().get(f'args.{lang_arg}').apply(self.context.langs.__contains__),
@@ -95,7 +106,7 @@ class ValidDataMgr:
         args = (lang_arg:='lang', 'word')
         for lang, word in c(scrap_results).filter(self.is_arg_set_valid(kinds, lang_arg)).map(c().get('args').at(*args)).value():
             yield lang, word, False
-            if word in self.context.words and self.context.is_mapped(word):
+            if self.context.is_mapped(word):
                 yield lang, self.context.get_unmmapped(word), True
 
     def _gather_for_from_main_translations(self, scrap_results: Iterable[Outcome]) -> Iterable[Sequence[str]]:
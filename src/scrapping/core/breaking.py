@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import time
+from enum import Enum
+from threading import Lock
+
+from requests.exceptions import HTTPError
+
+from .web_building import PerHost
+from ...constants import BreakerConstants
+
+
+class CircuitOpenException(HTTPError):
+    pass
+
+
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """
+    Stops calling a host after consecutive failures and lets a single probe through once it has cooled down
+    """
+    def __init__(self, host: str,
+                 threshold: int = BreakerConstants.FAILURE_THRESHOLD,
+                 cool_down: float = BreakerConstants.COOL_DOWN,
+        ):
+        self.host = host
+        self.threshold = threshold
+        self.cool_down = cool_down
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._changed_at = 0.
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    def allow(self) -> None:
+        """
+        :raises CircuitOpenException: if the host is not to be called now
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return
+            if (waited := time.monotonic() - self._changed_at) < self.cool_down:  # Open or the probe still in flight
+                raise CircuitOpenException(f'{self.host} is unavailable, not calling it for the next {self.cool_down - waited:.0f}s')
+            self._change(CircuitState.HALF_OPEN)
+
+    def succeed(self) -> None:
+        with self._lock:
+            self.failures = 0
+            if self.state != CircuitState.CLOSED:
+                self._change(CircuitState.CLOSED)
+
+    def fail(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == CircuitState.HALF_OPEN or self.failures >= self.threshold:
+                self._change(CircuitState.OPEN)
+
+    def _change(self, state: CircuitState) -> None:
+        self.state = state
+        self._changed_at = time.monotonic()
+        logging.debug(f'{self.host} circuit {state.value} after {self.failures} failures')
+
+
+class Breakers(PerHost[CircuitBreaker]):
+    def __init__(self):
+        super().__init__(CircuitBreaker)
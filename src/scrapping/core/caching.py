@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
+
+from ...constants import CacheConstants
+from ...resouce_managing.disk_cache import DiskCache
+from .web_building import normalize_url
+
+
+class CacheMissException(HTTPError):
+    pass
+
+
+class ResponseCache:
+    """
+    Keeps the successful responses on disk, so that the repeated lookups need no network
+    """
+    kept_headers = ('Content-Type',)
+
+    def __init__(self, directory: Path | str,
+                 max_size: int = CacheConstants.MAX_RESPONSE_CACHE_SIZE,
+                 ttls: dict[str, float] = None,
+        ):
+        self.disk_cache = DiskCache(directory, max_size=max_size)
+        self.ttls = CacheConstants.RESPONSE_TTLS if ttls is None else ttls
+
+    @classmethod
+    def get_key(cls, url: str, params: dict = None) -> str:
+        return normalize_url(url, params)
+
+    def get_ttl(self, url: str) -> float:
+        return self.ttls.get(urlsplit(url).hostname, CacheConstants.DEFAULT_RESPONSE_TTL)
+
+    def load(self, url: str, params: dict = None) -> Optional[Response]:
+        key = self.get_key(url, params)
+        if (content := self.disk_cache.get(key, ttl=self.get_ttl(url))) is None:
+            return None
+        logging.debug(f'Cache hit: {key}')
+        meta, body = content.split(b'\n', 1)
+        meta = json.loads(meta)
+        response = Response()
+        response.status_code = meta['status_code']
+        response.url = meta['url']
+        response.encoding = meta['encoding']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response._content = body
+        response.from_cache = True
+        return response
+
+    def save(self, response: Response, url: str, params: dict = None) -> None:
+        meta = {
+            'status_code': response.status_code,
+            'url': response.url,
+            'encoding': response.encoding,
+            'headers': {name: response.headers[name] for name in self.kept_headers if name in response.headers},
+        }
+        self.disk_cache.put(self.get_key(url, params), json.dumps(meta).encode() + b'\n' + response.content)
+
+
+class ResultCache:
+    """
+    Keeps the successfully parsed results in memory and on disk, so that the repeated lookups need no parsing.
+    The entries are bound to the version of the parser that produced them
+    """
+    GATHERED = 'gathered'  # The kind of the marks of the results whose data was gathered
+    def __init__(self, directory: Path | str = None,
+                 max_size: int = CacheConstants.MAX_RESULT_CACHE_SIZE,
+                 max_memory_entries: int = CacheConstants.MAX_MEMORY_RESULTS,
+                 ttls: dict[str, float] = None,
+        ):
+        self.disk_cache = DiskCache(directory, max_size=max_size) if directory else None
+        self.max_memory_entries = max_memory_entries
+        self.ttls = CacheConstants.RESULT_TTLS if ttls is None else ttls
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = RLock()
+
+    @classmethod
+    def get_key(cls, kind: str, args: dict[str, str], version: str) -> str:
+        return json.dumps([kind, version, sorted(args.items())], ensure_ascii=False)
+
+    def get_ttl(self, kind: str) -> float:
+        return self.ttls.get(kind, CacheConstants.DEFAULT_RESULT_TTL)
+
+    def load(self, kind: str, args: dict[str, str], version: str) -> Optional[Any]:
+        key, ttl = self.get_key(kind, args, version), self.get_ttl(kind)
+        with self._lock:
+            if (entry := self._memory.get(key)) is not None:
+                saved_at, results = entry
+                if time.time() - saved_at <= ttl:
+                    self._memory.move_to_end(key)
+                    return results
+                del self._memory[key]
+        if self.disk_cache is None or (content := self.disk_cache.get(key, ttl=ttl)) is None:
+            return None
+        try:
+            results = pickle.loads(content)
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:  # Stale classes
+            logging.debug(f'Dropping unloadable result {key}: {e}')
+            return None
+        self._remember(key, results)
+        return results
+
+    def save(self, kind: str, args: dict[str, str], version: str, results: Any) -> None:
+        key = self.get_key(kind, args, version)
+        self._remember(key, results)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _remember(self, key: str, results: Any) -> None:
+        with self._lock:
+            self._memory[key] = (time.time(), results)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
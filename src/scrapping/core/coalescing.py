@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future
+from threading import Lock, get_ident
+from typing import Any, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Lets the callers of the same key share a single execution and keeps its outcome for the repeated ones until forgotten
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.executions = 0
+        self._flights: dict[Hashable, Future] = {}
+        self._leaders: dict[Hashable, int] = {}
+        self._lock = Lock()
+
+    @property
+    def saved(self) -> int:
+        return self.calls - self.executions
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            self.calls += 1
+            leading = reentered = False
+            if (flight := self._flights.get(key)) is None:
+                flight = self._flights[key] = Future()
+                self._leaders[key] = get_ident()
+                leading = True
+            elif self._leaders.get(key) == get_ident():
+                reentered = True
+            self.executions += leading or reentered
+        if reentered:  # Waiting for its own flight would never end
+            return func(*args)
+        if leading:
+            try:
+                flight.set_result(func(*args))
+            except BaseException as e:
+                flight.set_exception(e)
+            finally:
+                with self._lock:
+                    self._leaders.pop(key, None)
+        return flight.result()
+
+    def forget(self) -> None:
+        """
+        Drops the finished flights, the ones still in the air stay shared
+        """
+        with self._lock:
+            logging.debug(f'{self.name}: {self.saved} of {self.calls} calls saved by coalescing')
+            self._flights = {key: flight for key, flight in self._flights.items() if not flight.done()}
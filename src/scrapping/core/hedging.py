@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from threading import Lock
+from typing import Optional
+
+from .web_building import PerHost
+from ...constants import HedgeConstants
+
+
+class Hedger:
+    """
+    Tells how long to wait for a host's response before sending a duplicate,
+    allowing the duplicates only as a fraction of the requests sent
+    """
+    def __init__(self, host: str,
+                 window: int = HedgeConstants.LATENCY_WINDOW,
+                 budget_ratio: float = HedgeConstants.BUDGET_RATIO,
+                 max_budget: float = HedgeConstants.MAX_BUDGET,
+        ):
+        self.host = host
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.budget_ratio = budget_ratio
+        self.max_budget = max_budget
+        self.budget = 0.
+        self.hedges = 0
+        self._lock = Lock()
+
+    def get_delay(self, percentile: float) -> Optional[float]:
+        """
+        :return: None until enough latencies are known
+        """
+        with self._lock:
+            if len(self.latencies) < HedgeConstants.MIN_SAMPLES:
+                return None
+            latencies = sorted(self.latencies)
+        return latencies[round(percentile / 100 * (len(latencies) - 1))]
+
+    def observe(self, started_at: float) -> None:
+        with self._lock:
+            self.latencies.append(time.monotonic() - started_at)
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.budget = min(self.budget + self.budget_ratio, self.max_budget)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.budget < 1:
+                return False
+            self.budget -= 1
+            self.hedges += 1
+            return True
+
+
+class Hedgers(PerHost[Hedger]):
+    def __init__(self):
+        super().__init__(Hedger)
@@ -1,29 +1,117 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
 from dataclasses import dataclass
-from functools import wraps
-from typing import Iterator
+from functools import partial, wraps
+from threading import RLock
+from typing import Callable, Iterator, Optional
 
-from bs4 import BeautifulSoup, PageElement
+from bs4 import BeautifulSoup, PageElement, SoupStrainer
 from bs4.element import Tag
 from requests import Response
 
-
-def ensure_tag(to_parse: Response | Tag | str) -> Tag:
+from ...context_domain import HtmlParser
+
+query_html_parser: ContextVar[HtmlParser] = ContextVar('query_html_parser', default='lxml')  # Of the query being scrapped
+
+
+def with_html_parser(features: HtmlParser) -> Context:
+    """
+    :return: a copy of the current context variables to run the query's scraps in, with the pages parsed by features
+    """
+    variables = copy_context()
+    variables.run(query_html_parser.set, features)
+    return variables
+
+def build_soup(markup: str, features: HtmlParser, regions: SoupStrainer = None) -> BeautifulSoup:
+    """
+    :param regions: the only subtrees to keep, html5lib cannot skip the rest and builds the whole tree
+    """
+    parse_only = regions if features != 'html5lib' else None
+    return BeautifulSoup(markup, features=features, parse_only=parse_only, string_containers={})  # Keeping all the texts as html5lib does
+
+def with_classes(*classes: str) -> Callable[[Optional[str]], bool]:
+    """
+    A class filter for SoupStrainer, which compares the raw attribute otherwise
+    """
+    return lambda value: value is not None and set(classes) <= set(value.split() if isinstance(value, str) else value)
+
+def ensure_tag(to_parse: Response | Tag | str, features: HtmlParser = None, regions: SoupStrainer = None) -> Tag:
+    """
+    :param features: the query's html parser if not given
+    """
+    features = features or query_html_parser.get()
     match to_parse:
         case Tag(): return to_parse
-        case str(): return BeautifulSoup(to_parse, features="html5lib")
-        case Response(): return ensure_tag(to_parse.text)
+        case str(): return build_soup(to_parse, features, regions)
+        case Response(): return Document.of(to_parse).get_tag(features, regions)
         case _: raise ValueError(f'Cannot handle type {type(to_parse)} of {to_parse}!')
 
-def with_ensured_tag(func):
+def with_ensured_tag(func=None, *, regions: SoupStrainer = None):
+    """
+    :param regions: what the decorated parsing needs of the page, including for the parsings it passes the tag to
+    """
+    if func is None:
+        return partial(with_ensured_tag, regions=regions)
+
     @wraps(func)
     def wrapper(self, tag, *args, **kwargs):
-        return func(self, ensure_tag(tag), *args, **kwargs)
+        if not isinstance(tag, str):
+            return func(self, ensure_tag(tag, regions=regions), *args, **kwargs)
+        soup = ensure_tag(tag, regions=regions)
+        try:
+            return func(self, soup, *args, **kwargs)
+        finally:
+            soup.decompose()  # Built for this call only
     return wrapper
 
 
+class Document:
+    """
+    The trees of a response, each built once for all of its users and freed when none is left
+    """
+    def __init__(self, response: Response):
+        self.response = response
+        self._tags: dict[tuple[HtmlParser, Optional[SoupStrainer]], Tag] = {}
+        self._users = 0
+        self._lock = RLock()
+
+    @classmethod
+    def of(cls, response: Response) -> Document:
+        if (document := response.__dict__.get('document')) is None:
+            document = response.__dict__.setdefault('document', cls(response))
+        return document
+
+    def contains(self, marker: bytes) -> bool:
+        return marker in self.response.content
+
+    def get_tag(self, features: HtmlParser, regions: SoupStrainer = None) -> Tag:
+        with self._lock:
+            if (tag := self._tags.get((features, regions))) is None:
+                tag = self._tags[features, regions] = build_soup(self.response.text, features, regions)
+            return tag
+
+    @contextmanager
+    def use(self) -> Iterator[Document]:
+        with self._lock:
+            self._users += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._users -= 1
+                if not self._users:
+                    self.free()
+
+    def free(self) -> None:
+        with self._lock:
+            for tag in self._tags.values():
+                tag.decompose()
+            self._tags.clear()
+
+
 @dataclass(frozen=True)
 class Result:
     pass
@@ -39,6 +127,9 @@ class CaptchaException(ParsingException):
 
 
 class Parser(ABC):
+    version: str = '1'  # Bump when the results change, so that the cached ones get invalidated
+    captcha_class: str = 'g-recaptcha'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -48,9 +139,23 @@ class Parser(ABC):
         raise NotImplementedError
 
     @classmethod
-    @with_ensured_tag
-    def is_captcha(cls, tag: Tag) -> bool:
-        return bool(tag.find('div', {'class': 'g-recaptcha'}))
+    def has_captcha_marker(cls, response: Response) -> bool:
+        """
+        Tells the pages that may be captchas from their raw content alone, without building their tree
+        """
+        return Document.of(response).contains(cls.captcha_class.encode())
+
+    @classmethod
+    def is_captcha(cls, to_check: Response | Tag | str) -> bool:
+        match to_check:  # Sparing building the tree for the pages without the marker
+            case Response() if not cls.has_captcha_marker(to_check): return False
+            case str() if cls.captcha_class not in to_check: return False
+        return cls._has_captcha(to_check)
+
+    @classmethod
+    @with_ensured_tag(regions=SoupStrainer('div', class_=with_classes(captcha_class)))
+    def _has_captcha(cls, tag: Tag) -> bool:
+        return bool(tag.find('div', {'class': cls.captcha_class}))
 
     @classmethod
     def filter_to_tags(cls, elems: Iterator[PageElement]) -> Iterator[Tag]:
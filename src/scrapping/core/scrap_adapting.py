@@ -1,16 +1,64 @@
-from functools import lru_cache
-from typing import Any, Callable, Iterable, Optional
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import cached_property
+from typing import Callable, Optional
 
 from bs4 import Tag
 from requests import Response, Session
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 
-from .parsing import CaptchaException, Parser, ParsingException, Result
+from .breaking import Breakers, CircuitBreaker
+from .caching import CacheMissException, ResponseCache
+from .coalescing import SingleFlight
+from .hedging import Hedger, Hedgers
+from .parsing import CaptchaException, Document, Parser, ParsingException, Result, query_html_parser
+from .throttling import HostThrottle, Throttles
+from .web_building import normalize_url
+from ...constants import HedgeConstants, ScrapConstants, ThrottleConstants
 
 
 class ScrapAdapter:
-    def __init__(self, session: Session = None):
+    warm_up_urls: tuple[str, ...] = ()
+
+    def __init__(self, session: Session = None, response_cache: ResponseCache = None):
         self.session: Optional[Session] = session
+        self.response_cache: Optional[ResponseCache] = response_cache
+        self.offline: bool = False
+        self.throttles = Throttles()
+        self.breakers = Breakers()
+        self.hedgers = Hedgers()
+        self.hedge_percentile: Optional[float] = None  # Not hedging
+        self.scrap_flights = SingleFlight(f'{type(self).__name__} scraps')
+        self.fetch_flights = SingleFlight(f'{type(self).__name__} fetches')
+
+    @cached_property
+    def request_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=HedgeConstants.MAX_REQUEST_WORKERS, thread_name_prefix='request')
+
+    @cached_property
+    def hedge_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=HedgeConstants.MAX_WORKERS, thread_name_prefix='hedge')
+
+    @property
+    def flights(self) -> tuple[SingleFlight, ...]:
+        return self.scrap_flights, self.fetch_flights
+
+    def forget_flights(self) -> None:
+        for flights in self.flights:
+            flights.forget()
+
+    def warm_up(self) -> None:
+        """
+        Opens the connections to the hosts ahead of the lookups, sparing them the handshakes
+        """
+        for url in self.warm_up_urls:
+            if self.offline or self.session is None or self.breakers.of(url).is_open:
+                return
+            try:
+                self.session.head(url, timeout=ScrapConstants.TIMEOUT)
+            except RequestException as e:
+                logging.debug(f'Could not warm up {url}: {e}')
 
     def scrap(self,
               url: str,
@@ -18,21 +66,123 @@ class ScrapAdapter:
               params: dict = None,
               headers: dict = None
         ) -> list[Result] | HTTPError | ParsingException:
+        """
+        The callers of the same url, parser and html parser share one fetch and parse
+        """
+        return self.scrap_flights.do((normalize_url(url, params), parse, query_html_parser.get()), self._scrap, url, parse, params, headers)
+
+    def _scrap(self,
+               url: str,
+               parse: Callable[[Response | Tag | str], list[Result] | ParsingException],
+               params: dict = None,
+               headers: dict = None
+        ) -> list[Result] | HTTPError | ParsingException:
         try:
-            # response = self.session.get(url, allow_redirects=True, params=params, headers=headers)
-            response = self.get_response(
-                url,
-                params=params and tuple(params.items()),
-                headers=headers and tuple(headers.items()),
-            )
+            response = self.get_response(url, params=params, headers=headers)
             response.raise_for_status()
-        except HTTPError as e:
+        except RequestException as e:  # Including the connection failures and timeouts
             return e
         else:
+            return self._parse_response(response, parse, url, params)
+
+    def _parse_response(self,
+                        response: Response,
+                        parse: Callable[[Response | Tag | str], list[Result] | ParsingException],
+                        url: str,
+                        params: dict = None,
+        ) -> list[Result] | ParsingException:
+        with Document.of(response).use():
             if Parser.is_captcha(response):
                 return CaptchaException('Captcha appeared, robot identified!')
+            if self.response_cache and not getattr(response, 'from_cache', False):
+                self.response_cache.save(response, url, params)
             return parse(response)
 
-    @lru_cache(maxsize=2)
-    def get_response(self, url: str, params: Iterable[tuple[Any, Any]], headers: Iterable[tuple[Any, Any]]) -> Response:
-        return self.session.get(url, allow_redirects=True, params=params and dict(params), headers=headers and dict(headers))
+    def get_cached_response(self, url: str, params: dict = None) -> Optional[Response]:
+        if self.response_cache and (response := self.response_cache.load(url, params)) is not None:
+            return response
+        if self.offline:
+            raise CacheMissException(f'Not cached, cannot look up {url} offline')
+        return None
+
+    def get_response(self, url: str, params: dict = None, headers: dict = None) -> Response:
+        return self.fetch_flights.do(normalize_url(url, params), self._get_response, url, params, headers)
+
+    def _get_response(self, url: str, params: dict = None, headers: dict = None) -> Response:
+        if (response := self.get_cached_response(url, params)) is not None:
+            return response
+        throttle, breaker = self.throttles.of(url), self.breakers.of(url)
+        for retries_left in reversed(range(ThrottleConstants.RETRIES + 1)):
+            breaker.allow()
+            started_at = throttle.acquire()
+            try:
+                response = self._get(url, params, headers, throttle)
+            except (ConnectionError, Timeout):
+                breaker.fail()
+                raise
+            if not self._should_retry(throttle, breaker, response, started_at, retries_left):
+                break
+        return response
+
+    def _get(self, url: str, params: Optional[dict], headers: Optional[dict], throttle: HostThrottle) -> Response:
+        """
+        Sends a duplicate of a request slower than most of the host's recent ones, if the throttle and the hedging budget allow,
+        and takes whichever answers first. The request itself is sent on a pool apart from the hedges', so that no queueing behind
+        them counts towards its delay. The throttle's slot taken for the request is released once it is done, even if the hedge
+        answered first
+        """
+        get = lambda: self.session.get(url, allow_redirects=True, params=params, headers=headers, timeout=ScrapConstants.TIMEOUT)
+        if self.hedge_percentile is None:
+            try:
+                return get()
+            finally:
+                throttle.release()
+        hedger = self.hedgers.of(url)
+        hedger.deposit()
+        primary = self.request_executor.submit(self._timed, hedger, get)
+        primary.add_done_callback(lambda _: throttle.release())
+        requests = [primary]
+        if not wait(requests, timeout=hedger.get_delay(self.hedge_percentile)).done and self._try_hedge(hedger, throttle, url):
+            hedge = self.hedge_executor.submit(self._timed, hedger, get)
+            hedge.add_done_callback(lambda _: throttle.release())
+            requests.append(hedge)
+        errors = []
+        for request in as_completed(requests):
+            try:
+                return request.result()
+            except Exception as e:
+                errors.append(e)
+        raise errors[0]
+
+    @classmethod
+    def _try_hedge(cls, hedger: Hedger, throttle: HostThrottle, url: str) -> bool:
+        if not throttle.try_acquire():
+            return False
+        if not hedger.try_spend():
+            throttle.release()
+            return False
+        logging.debug(f'Hedging {url}, {hedger.hedges} hedges so far')
+        return True
+
+    @classmethod
+    def _timed(cls, hedger: Hedger, get: Callable[[], Response]) -> Response:
+        started_at = time.monotonic()
+        response = get()
+        hedger.observe(started_at)
+        return response
+
+    @classmethod
+    def _should_retry(cls, throttle: HostThrottle, breaker: CircuitBreaker, response: Response, started_at: float, retries_left: int) -> bool:
+        """
+        Tells the throttle and the breaker how the host answered, the throttled requests get retried once they let them
+        """
+        if not Throttles.is_throttling(response) and not Parser.has_captcha_marker(response):  # The tree is left for the parsing to build
+            throttle.succeed()
+            breaker.succeed()
+            return False
+        breaker.fail()
+        wait = throttle.throttle(started_at, Throttles.get_retry_after(response))
+        if not retries_left or wait > ThrottleConstants.MAX_RETRY_AFTER or breaker.is_open:
+            return False
+        logging.debug(f'Retrying {response.url} in {wait:.2f}s after {response.status_code}')
+        return True
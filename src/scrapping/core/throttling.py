@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Optional
+
+from requests import Response
+
+from .web_building import PerHost
+from ...constants import ThrottleConstants
+
+
+class HostThrottle:
+    """
+    Paces the requests to a host with a token bucket and an adaptive concurrency limit.
+    Both grow additively while the host answers and shrink multiplicatively once it throttles
+    """
+    def __init__(self, host: str,
+                 rate: float = ThrottleConstants.INITIAL_RATE,
+                 limit: float = ThrottleConstants.INITIAL_LIMIT,
+        ):
+        self.host = host
+        self.rate = rate
+        self.limit = limit
+        self.in_flight = 0
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.
+        self._decreased_at = 0.
+        self._lock = Lock()
+
+    @property
+    def burst(self) -> float:
+        return max(self.rate * ThrottleConstants.BURST, 1.)
+
+    def _try_acquire(self) -> float:
+        """
+        :return: 0 if a request may start, the seconds to wait before trying again otherwise
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._refilled_at) * self.rate, self.burst)
+            self._refilled_at = now
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self.in_flight >= int(self.limit):
+                return ThrottleConstants.POLL_INTERVAL
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a slot only if it is free right away, to be released by the caller
+        """
+        return self._try_acquire() == 0
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def acquire(self) -> float:
+        """
+        Waits for a slot, to be released by the caller once the request is done
+        :return: when the request started, to tell the feedback on it apart from the older ones
+        """
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
+        return time.monotonic()
+
+    def succeed(self) -> None:
+        with self._lock:
+            self.limit = min(self.limit + ThrottleConstants.LIMIT_INCREASE / self.limit, ThrottleConstants.MAX_LIMIT)
+            self.rate = min(self.rate + ThrottleConstants.RATE_INCREASE / self.rate, ThrottleConstants.MAX_RATE)
+
+    def throttle(self, started_at: float, retry_after: Optional[float] = None) -> float:
+        """
+        Backs off once per throttling, the requests started before the last decrease are not counted again
+        :return: the seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            if started_at >= self._decreased_at:
+                self._decreased_at = now
+                self.limit = max(self.limit * ThrottleConstants.DECREASE, ThrottleConstants.MIN_LIMIT)
+                self.rate = max(self.rate * ThrottleConstants.DECREASE, ThrottleConstants.MIN_RATE)
+                self._tokens = 0.
+                logging.debug(f'{self.host} throttled: limit {self.limit:.2f}, rate {self.rate:.2f}/s')
+            wait = ThrottleConstants.BACKOFF / self.rate if retry_after is None else retry_after
+            self._blocked_until = max(self._blocked_until, now + min(wait, ThrottleConstants.MAX_RETRY_AFTER))
+            return max(wait, self._blocked_until - now)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.host}: limit {self.limit:.2f}, {self.in_flight} in flight, rate {self.rate:.2f}/s)'
+
+
+class Throttles(PerHost[HostThrottle]):
+    def __init__(self):
+        super().__init__(HostThrottle)
+
+    def log(self) -> None:
+        for throttle in self:
+            logging.debug(throttle)
+
+    @classmethod
+    def is_throttling(cls, response: Response) -> bool:
+        return response.status_code in ThrottleConstants.THROTTLING_STATUSES or response.status_code >= 500
+
+    @classmethod
+    def get_retry_after(cls, response: Response) -> Optional[float]:
+        if not (retry_after := response.headers.get('Retry-After')):
+            return None
+        try:
+            return max(float(retry_after), 0.)
+        except ValueError:
+            pass
+        try:
+            return max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0.)
+        except (TypeError, ValueError):
+            return None
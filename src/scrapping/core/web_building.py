@@ -1,3 +1,14 @@
+from threading import Lock
+from typing import Callable, Generic, Iterator, TypeVar
+from http.client import RemoteDisconnected
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote, unquote
+
+from urllib3 import Retry
+from urllib3.exceptions import ProtocolError
+
+T = TypeVar('T')
+
+
 def get_default_headers():
     return {
         'User-Agent': f'Scraplang/3.8.1 (piotr10tutek@poczta.onet.pl)',
@@ -8,5 +19,47 @@ def get_default_headers():
         'Referer': 	'http://www.google.com/',
     }
 
+def normalize_url(url: str, params: dict = None) -> str:
+    """
+    Gives the same url for the same resource regardless of the host's case, the params' order and their escaping
+    """
+    scheme, netloc, path, query, _ = urlsplit(url)
+    all_params = sorted(parse_qsl(query, keep_blank_values=True) + [(str(key), str(val)) for key, val in (params or {}).items()])
+    return urlunsplit((scheme.lower(), netloc.lower(), quote(unquote(path)), urlencode(all_params), ''))
+
+
+class StaleRetry(Retry):
+    """
+    Retries the failed connections and the kept-alive ones the host has closed before answering, but not the timed out reads
+    """
+
+    def _is_connection_error(self, err: Exception) -> bool:
+        return super()._is_connection_error(err) or self.is_stale(err)
+
+    @classmethod
+    def is_stale(cls, err: Exception) -> bool:
+        return isinstance(err, ProtocolError) and any(isinstance(arg, (RemoteDisconnected, BrokenPipeError)) for arg in err.args)
+
+
+class PerHost(Generic[T]):
+    """
+    Keeps one of T per host, made on the first url of the host
+    """
+    def __init__(self, make: Callable[[str], T]):
+        self._make = make
+        self._per_host: dict[str, T] = {}
+        self._lock = Lock()
+
+    def of(self, url: str) -> T:
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            if (of_host := self._per_host.get(host)) is None:
+                of_host = self._per_host[host] = self._make(host)
+            return of_host
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._per_host.values()))
+
+
 class UrlBuilder:
     MAIN_URL: str = ''
@@ -1,21 +1,24 @@
+from __future__ import annotations
+
 import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
 from io import StringIO
 from itertools import product
-from tkinter.scrolledtext import example
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import pandas as pd
 import pydash as _
+import soupsieve as sv
+from bs4 import SoupStrainer
 from bs4.element import ResultSet, Tag
 from more_itertools import bucket
-from numpy.lib.recfunctions import join_by
-from pandas import DataFrame
 from pydash import chain as c, flow, partial
 
-from ..core.parsing import Parser, ParsingException, Result, with_ensured_tag
+from ..core.parsing import Parser, ParsingException, Result, with_classes, with_ensured_tag
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 class TransResultKind(Enum):
@@ -36,8 +39,15 @@ class TransResult(Result):
 
 
 class TranslationParser(Parser):
+    version: str = '1'
+    _translation_regions = SoupStrainer('article')
+    _indirect_regions = SoupStrainer('button', class_=with_classes('font-medium', 'break-all', 'flex-inline', 'focus:outline-none'))
+    _main_section_selector = sv.compile('article div div section')
+    _translated_word_selector = sv.compile('h3')
+    _span_selector = sv.compile('span')
+
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_translation_regions)
     def parse(cls, tag: Tag) -> list[TransResult] | ParsingException:
         if isinstance(mains := cls._parse_main_translations(tag), Exception):
             return mains
@@ -48,7 +58,7 @@ class TranslationParser(Parser):
     @classmethod
     def _parse_main_translations(cls, tag: Tag) -> list[TransResult] | ParsingException:
         logging.debug('Parsing main translations')
-        if not (main_section := tag.select_one('article div div section')) or not (trans_divs := main_section.find_all('div', {'class': 'inline leading-10'})):
+        if not (main_section := cls._main_section_selector.select_one(tag)) or not (trans_divs := main_section.find_all('div', {'class': 'inline leading-10'})):
             return ParsingException('No translation div!', tag)
         translations = []
         for trans_div in trans_divs:
@@ -61,7 +71,7 @@ class TranslationParser(Parser):
         return translations
 
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_translation_regions)
     def parse_less_frequent_translations(cls, tag: Tag) -> list[TransResult] | ParsingException:
         logging.debug('Parsing less frequent translations')
         less_freq_tag = tag.find('ul', {'id': 'less-frequent-translations-container-0'})
@@ -73,7 +83,7 @@ class TranslationParser(Parser):
         return less_freqs
 
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_indirect_regions)
     def parse_indirect_translations(cls, tag: Tag) -> list[TransResult] | ParsingException:
         logging.debug('Parsing indirect translations')
         if not (translation_buttons := tag.find_all('button', {'class': 'font-medium break-all flex-inline focus:outline-none'})):
@@ -89,19 +99,24 @@ class TranslationParser(Parser):
     # To the below functions decorator or exception handling needed
     @classmethod
     def _get_translated_word(cls, translation_tag: Tag) -> str | ParsingException:
-        return translation_tag.select_one('h3').text.replace('\n', '')
+        return cls._translated_word_selector.select_one(translation_tag).text.replace('\n', '')
 
     @classmethod
     def _get_spans(cls, trans_tag: Tag) -> ResultSet[Tag] | ParsingException:
-        main_span = trans_tag.select_one('span', {'class': 'text-xxs text-gray-500'})
+        main_span = cls._span_selector.select_one(trans_tag)
         return main_span.find_all('span')
 
 
 class InflectionParser(Parser):
+    version: str = '1'
     _bold_selector = ':not(table b)'
+    _grammar_regions = SoupStrainer(id='grammar_0_0')
+    _table_selector = sv.compile('#grammar_0_0 table')
+    _grammar_item_selector = sv.compile('#grammar_0_0 ul li')
+    _inner_table_selector = sv.compile('table')
 
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_grammar_regions)
     def parse(cls, tag: Tag) -> DataFrame | str | ParsingException:
         logging.debug('Parsing inflection')
         if not isinstance(table := cls.parse_table(tag), Exception):
@@ -113,17 +128,18 @@ class InflectionParser(Parser):
 
     @classmethod
     def parse_table(cls, tag: Tag) -> Optional[DataFrame]:
-        if not (table_tags := tag.select('div #grammar_0_0 table')):
+        if not (table_tags := cls._table_selector.select(tag)):
             return ParsingException('No inflection table!')
+        import pandas as pd
         to_table = flow(str, StringIO, partial(pd.read_html, keep_default_na=False, header=None))
         to_table_or_none = c().apply_catch(to_table, {ValueError}, None)
         table = c(table_tags).flat_map(to_table_or_none).reject(_.is_none).head().value()
         return table
 
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_grammar_regions)
     def parse_grammar(cls, tag: Tag) -> Optional[list[list[str]]] | ParsingException:
-        if not (grammar_items := tag.select('div #grammar_0_0 ul li')):  # TODO: test: (en) man; (sv) mus, sida; (pl) łuk, chcieć; (de) Frau, gehen
+        if not (grammar_items := cls._grammar_item_selector.select(tag)):  # TODO: test: (en) man; (sv) mus, sida; (pl) łuk, chcieć; (de) Frau, gehen
             return ParsingException('No grammar info!')
         examples = c(grammar_items).filter(cls.is_grammar_item_valid).map(cls.extract_grammar_examples).filter(cls.discard_examples).value()
         uniques = cls.uniq_grammar_example_batches(examples)
@@ -132,7 +148,7 @@ class InflectionParser(Parser):
     @classmethod
     def is_grammar_item_valid(cls, item: Tag) -> bool:
         bolds = cls.get_bolds(item)
-        return bolds or not item.select('table') and ',' in item.text
+        return bolds or not cls._inner_table_selector.select(item) and ',' in item.text
 
     @classmethod
     def get_bolds(cls, tag: Tag) -> list[Tag]:
@@ -167,12 +183,14 @@ class DefResult(Result):
 
 
 class DefinitionParser(Parser):
+    version: str = '1'
     pos_form = re.compile('(?P<pos>.+)\n\n(?P<def>.+)', re.DOTALL)
     clean = c().join('').trim().trim(';')
     to_text = lambda tag: tag.text
+    _definition_regions = SoupStrainer('li', class_=with_classes('pb-2'))
 
     @classmethod
-    @with_ensured_tag
+    @with_ensured_tag(regions=_definition_regions)
     def parse(cls, tag: Tag) -> list[DefResult] | ParsingException:
         logging.debug('Parsing definitions')
         if not (definition_tags := tag.find_all('li', {'class': 'pb-2'})):
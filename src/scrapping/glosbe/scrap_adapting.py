@@ -9,6 +9,8 @@ from ..core.scrap_adapting import ScrapAdapter
 
 
 class GlosbeScrapAdapter(ScrapAdapter):
+    warm_up_urls = (f'https://{GlosbeUrlBuilder.MAIN_URL}/',)
+
     def scrap_main_translations(self, from_lang: str, to_lang: str, word: str) -> list[Result] | HTTPError | ParsingException:
         url = GlosbeUrlBuilder.get_word_trans_url(from_lang, to_lang, word)
         return self.scrap(url, TranslationParser.parse)
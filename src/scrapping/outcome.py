@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, is_dataclass
+from enum import Enum
 from functools import cache
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 from box import Box
-from pandas import DataFrame
 
 from .core.parsing import Result
 from ..context import Context
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+def is_data_frame(obj: Any) -> bool:
+    """
+    Tells a table apart by its type alone, neither importing pandas nor reading it off a module another thread may be importing
+    """
+    return any(cls.__name__ == 'DataFrame' and cls.__module__.startswith('pandas') for cls in type(obj).__mro__)
+
 
 # TODO: Everywhere fix hinting
 @dataclass(frozen=True)
@@ -53,6 +63,7 @@ class Outcome:
     kind: str | OutcomeKinds  # Incorect syntax, but there's no right solution
     args: Box = field(default_factory=Box)
     results: Optional[DataFrame | Iterable[Result]] = None
+    gathered: bool = field(default=False, compare=False)  # Loaded from the result cache with its data gathered before
 
     def __post_init__(self):
         if self.kind not in OutcomeKinds().all():
@@ -63,3 +74,21 @@ class Outcome:
 
     def is_success(self) -> bool:
         return not self.is_fail()
+
+    def to_record(self) -> dict:
+        """
+        :return: a JSON serializable summary, given Outcome.to_jsonable for the results
+        """
+        record = {'kind': self.kind, 'args': dict(self.args), 'ok': self.is_success()}
+        if self.is_fail():
+            return {**record, 'error': str(self.results.args[0] if self.results.args else self.results)}
+        return {**record, 'results': self.results}
+
+    @classmethod
+    def to_jsonable(cls, obj: Any) -> Any:
+        match obj:
+            case Enum(): return obj.value
+            case _ if is_data_frame(obj): return obj.values.tolist()
+            case _ if is_dataclass(obj): return asdict(obj)
+            case set() | frozenset() | tuple(): return list(obj)
+            case _: raise TypeError(f'Cannot serialize {type(obj)} of {obj}')
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import Context, copy_context
+from typing import Callable, Iterator, Optional
+
+from .outcome import Outcome
+
+
+class ScrapPlanner:
+    """
+    Runs the scrapping steps of a query as a dependency graph on a bounded pool
+    while keeping the order in which the outcomes were placed
+    """
+    def __init__(self, max_workers: int, variables: Context = None):
+        """
+        :param variables: the context variables of the query, each step runs in a copy of them
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrap')
+        self._variables = variables or copy_context()
+        self._order: list[Future] = []
+
+    def __enter__(self) -> ScrapPlanner:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def place(self, future: Future) -> Future:
+        self._order.append(future)
+        return future
+
+    def ready(self, outcome: Outcome, place: bool = True) -> Future:
+        future = Future()
+        future.set_result(outcome)
+        return self.place(future) if place else future
+
+    def submit(self, func: Callable[..., Outcome], *args, place: bool = True) -> Future:
+        future = self._executor.submit(self._variables.copy().run, func, *args)
+        return self.place(future) if place else future
+
+    def then(self,
+             dep: Future,
+             when: Callable[[Outcome], bool],
+             func: Callable[[Outcome], Outcome],
+             place: bool = True,
+        ) -> Future:
+        """
+        Schedules func on the outcome of dep once it's done and only if the condition holds, otherwise resolves to None
+        """
+        future = Future()
+
+        def on_done(done: Future) -> None:
+            if done.cancelled() or done.exception() or not when(done.result()):
+                future.set_result(None)
+                return
+            try:
+                chained = self._executor.submit(self._variables.copy().run, func, done.result())
+            except RuntimeError:  # Planner closed in the meantime
+                future.cancel()
+                return
+            chained.add_done_callback(lambda c: self._copy_result(c, future))
+
+        dep.add_done_callback(on_done)
+        return self.place(future) if place else future
+
+    def speculate(self,
+                  dep: Future,
+                  when: Callable[[Outcome], bool],
+                  speculation: Future,
+                  place: bool = True,
+        ) -> Future:
+        """
+        Keeps the outcome of the speculation started along dep only if the condition on dep's outcome holds, otherwise cancels it
+        and resolves to None, a speculation already running is left to finish unheard
+        """
+        future = Future()
+
+        def on_done(done: Future) -> None:
+            if done.cancelled() or done.exception() or not when(done.result()):
+                speculation.cancel()
+                future.set_result(None)
+                return
+            speculation.add_done_callback(lambda s: self._copy_result(s, future))
+
+        dep.add_done_callback(on_done)
+        return self.place(future) if place else future
+
+    @classmethod
+    def _copy_result(cls, source: Future, target: Future) -> None:
+        if source.cancelled():
+            target.cancel()
+        elif (e := source.exception()) is not None:
+            target.set_exception(e)
+        else:
+            target.set_result(source.result())
+
+    def outcomes(self) -> Iterator[Outcome]:
+        for future in self._order:
+            outcome: Optional[Outcome] = future.result()
+            if outcome is not None:
+                yield outcome
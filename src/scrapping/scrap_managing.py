@@ -1,25 +1,51 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from threading import Thread
+from typing import Any, Callable, Iterable, Optional
 from typing import TYPE_CHECKING
 
 from box import Box
 from requests import Session
 
+from ..constants import ScrapConstants
+from .core.caching import ResponseCache, ResultCache
+from .core.parsing import query_html_parser, with_html_parser
 from .core.scrap_adapting import ScrapAdapter
+from .glosbe.parsing import TranslationParser, InflectionParser, DefinitionParser
 from .glosbe.scrap_adapting import GlosbeScrapAdapter
 from .outcome import Outcome, OutcomeKinds
+from .planning import ScrapPlanner
+from .wiktio.parsing import WiktioParser
 from .wiktio.scrap_adapting import WiktioScrapAdapter
 
 if TYPE_CHECKING:
     from src.context import Context
+    from src.context_domain import HtmlParser
 
 
 class ScrapMgr:
-    def __init__(self, session: Session = None):
+    parser_versions: dict[str, str] = {
+        OutcomeKinds.MAIN_TRANSLATION: TranslationParser.version,
+        OutcomeKinds.INDIRECT_TRANSLATION: TranslationParser.version,
+        OutcomeKinds.INFLECTION: InflectionParser.version,
+        OutcomeKinds.GRAMAMR: InflectionParser.version,
+        OutcomeKinds.DEFINITION: DefinitionParser.version,
+        OutcomeKinds.WIKTIO: WiktioParser.version,
+    }
+
+    def __init__(self, session: Session = None,
+                 response_cache: ResponseCache = None,
+                 result_cache: ResultCache = None,
+                 max_workers: int = ScrapConstants.MAX_WORKERS,
+        ):
         self.glosbe_scrapper = GlosbeScrapAdapter()
         self.wiktio_scrapper = WiktioScrapAdapter()
         self.session = session
+        self.response_cache = response_cache
+        self.result_cache = result_cache
+        self.offline = False
+        self.hedge_percentile = None
+        self.max_workers = max_workers
 
     @property
     def session(self) -> Session:
@@ -31,80 +57,170 @@ class ScrapMgr:
         for scrapper in self.scrappers:
             scrapper.session = session
 
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, response_cache: Optional[ResponseCache]) -> None:
+        self._response_cache = response_cache
+        for scrapper in self.scrappers:
+            scrapper.response_cache = response_cache
+
+    @property
+    def offline(self) -> bool:
+        return self._offline
+
+    @offline.setter
+    def offline(self, offline: bool) -> None:
+        self._offline = offline
+        for scrapper in self.scrappers:
+            scrapper.offline = offline
+
+    @property
+    def hedge_percentile(self) -> Optional[float]:
+        return self._hedge_percentile
+
+    @hedge_percentile.setter
+    def hedge_percentile(self, hedge_percentile: Optional[float]) -> None:
+        self._hedge_percentile = hedge_percentile
+        for scrapper in self.scrappers:
+            scrapper.hedge_percentile = hedge_percentile
+
+    @property
+    def etymology_depth(self) -> int:
+        return self.wiktio_scrapper.etymology_depth
+
+    @etymology_depth.setter
+    def etymology_depth(self, etymology_depth: int) -> None:
+        self.wiktio_scrapper.etymology_depth = etymology_depth
+
     @property
     def scrappers(self) -> Iterable[ScrapAdapter]:
         return self.glosbe_scrapper, self.wiktio_scrapper
 
     def scrap(self, context: Context) -> Iterable[Outcome]:
+        try:
+            with ScrapPlanner(max_workers=self.max_workers, variables=with_html_parser(context.html_parser)) as planner:
+                self._plan(context, planner)
+                yield from planner.outcomes()
+        finally:
+            self.forget_flights()
+            self.log_throttles()
+
+    def forget_flights(self) -> None:
+        for scrapper in self.scrappers:
+            scrapper.forget_flights()
+
+    def warm_up(self) -> None:
+        """
+        Warms the connections up in the background
+        """
+        for scrapper in self.scrappers:
+            Thread(target=scrapper.warm_up, name=f'{type(scrapper).__name__} warm-up', daemon=True).start()
+
+    def log_throttles(self) -> None:
+        for scrapper in self.scrappers:
+            scrapper.throttles.log()
+
+    def _plan(self, context: Context, planner: ScrapPlanner) -> None:
         for scrap_it in context.iterate_args():
             from_lang, to_lang, word = scrap_it.args
             if scrap_it.is_first_in_poly_main_group():
-                yield Outcome(OutcomeKinds.get_main_separator(context), results=scrap_it.main_group)
+                planner.ready(Outcome(OutcomeKinds.get_main_separator(context), results=scrap_it.main_group))
             if scrap_it.is_first_in_poly_subgroup():
-                yield Outcome(OutcomeKinds.SUBGROUP_SEPERATOR, results=scrap_it.subgroup)
+                planner.ready(Outcome(OutcomeKinds.SUBGROUP_SEPERATOR, results=scrap_it.subgroup))
             if context.is_at_from():
                 if scrap_it.is_at_inflection():
-                    yield self.scrap_inflections(from_lang, word)
+                    planner.submit(self.scrap_inflections, from_lang, word)
                 if scrap_it.is_at_grammar():
-                    yield self.scrap_grammar(from_lang, word)
+                    planner.submit(self.scrap_grammar, from_lang, word)
             if scrap_it.is_at_translation():
-                main = self.scrap_main_translations(from_lang, to_lang, word)
-                if context.is_at_to() and main.is_success():
+                main = planner.submit(self.scrap_main_translations, from_lang, to_lang, word, place=False)
+                if context.is_at_to():
                     if scrap_it.is_at_inflection():   # TODO: test is_success (ex. lubieć -it instread of lubić)
-                        yield self.scrap_inflections(to_lang, main.results[0].word)
+                        planner.then(main, Outcome.is_success, self._for_translated(self.scrap_inflections, to_lang))
                     if scrap_it.is_at_grammar():
-                        yield self.scrap_grammar(to_lang, main.results[0].word)
-                yield main
-                if context.indirect == 'on' or context.indirect == 'fail' and main.is_fail():
-                    yield self.scrap_indirect_translations(from_lang, to_lang, word)
-                if context.is_at_to() and scrap_it.is_at_wiktio() and main.is_success():
-                    yield self.scrap_wiktio(to_lang, main.results[0].word)
-                if context.is_at_to() and scrap_it.is_at_definition() and main.is_success():
-                    yield self.scrap_wiktio(to_lang, main.results[0].word)
+                        planner.then(main, Outcome.is_success, self._for_translated(self.scrap_grammar, to_lang))
+                planner.place(main)
+                if context.indirect == 'on':
+                    planner.submit(self.scrap_indirect_translations, from_lang, to_lang, word)
+                if context.indirect == 'fail' and context.speculative_indirect:  # Along the main one, not to wait for it to fail first
+                    speculation = planner.submit(self.scrap_indirect_translations, from_lang, to_lang, word, place=False)
+                    planner.speculate(main, Outcome.is_fail, speculation)
+                elif context.indirect == 'fail':
+                    planner.then(main, Outcome.is_fail, self._regardless(self.scrap_indirect_translations, from_lang, to_lang, word))
+                if context.is_at_to() and scrap_it.is_at_wiktio():
+                    planner.then(main, Outcome.is_success, self._for_translated(self.scrap_wiktio, to_lang))
+                if context.is_at_to() and scrap_it.is_at_definition():
+                    planner.then(main, Outcome.is_success, self._for_translated(self.scrap_wiktio, to_lang))
             if context.is_at_from() and scrap_it.is_at_wiktio():
-                yield self.scrap_wiktio(from_lang, word)
+                planner.submit(self.scrap_wiktio, from_lang, word)
             if scrap_it.is_at_definition():
-                yield self.scrap_definitions(from_lang, word)
-                yield Outcome(OutcomeKinds.NEWLINE)
-
-    def scrap_inflections(self, lang: str, word: str) -> Outcome:
-        return Outcome(  # TODO: handle double tables?
-            kind=OutcomeKinds.INFLECTION,
-            args=(args := Box(lang=lang, word=word, frozen_box=True)),
-            results=self.glosbe_scrapper.scrap_inflection(**args)
-        )
+                planner.submit(self.scrap_definitions, from_lang, word)
+                planner.ready(Outcome(OutcomeKinds.NEWLINE))
+
+    @classmethod
+    def _for_translated(cls, scrap: Callable[[str, str], Outcome], lang: str) -> Callable[[Outcome], Outcome]:
+        return lambda main: scrap(lang, main.results[0].word)
+
+    @classmethod
+    def _regardless(cls, scrap: Callable[..., Outcome], *args) -> Callable[[Outcome], Outcome]:
+        return lambda _: scrap(*args)
+
+    def _scrap_cached(self, kind: str, args: Box, scrap: Callable[..., Any]) -> Outcome:
+        if (results := self._load_results(kind, args)) is not None:
+            return Outcome(kind=kind, args=args, results=results, gathered=self._is_gathered(kind, args))
+        return Outcome(kind=kind, args=args, results=self._save_results(kind, args, scrap(**args)))
+
+    def mark_gathered(self, outcomes: Iterable[Outcome], html_parser: HtmlParser) -> None:
+        """
+        Notes the outcomes' data as gathered, for their cached results not to be gathered again.
+        The batch and the server do not gather, so their results stay to be gathered by a later lookup
+        :param html_parser: the one of the query the outcomes come from
+        """
+        if not self.result_cache:
+            return
+        for outcome in outcomes:
+            if outcome.kind in self.parser_versions and outcome.is_success() and not outcome.gathered:
+                self.result_cache.save(ResultCache.GATHERED, {'kind': outcome.kind, **outcome.args}, self.get_parser_version(outcome.kind, html_parser), True)
+
+    def _is_gathered(self, kind: str, args: Box) -> bool:
+        return self.result_cache.load(ResultCache.GATHERED, {'kind': kind, **args}, self.get_parser_version(kind)) is not None
+
+    def _load_results(self, kind: str, args: Box) -> Optional[Any]:
+        if not self.result_cache:
+            return None
+        return self.result_cache.load(kind, args, self.get_parser_version(kind))
+
+    def _save_results(self, kind: str, args: Box, results: Any) -> Any:
+        if self.result_cache and not isinstance(results, Exception):
+            self.result_cache.save(kind, args, self.get_parser_version(kind), results)
+        return results
+
+    def get_parser_version(self, kind: str, html_parser: HtmlParser = None) -> str:
+        """
+        :param html_parser: the query's one if not given
+        """
+        version = f'{self.parser_versions[kind]}/{html_parser or query_html_parser.get()}'
+        if kind == OutcomeKinds.WIKTIO:  # The etymologies reach as far as allowed
+            version += f'/{self.etymology_depth}'
+        return version
+
+    def scrap_inflections(self, lang: str, word: str) -> Outcome:  # TODO: handle double tables?
+        return self._scrap_cached(OutcomeKinds.INFLECTION, Box(lang=lang, word=word, frozen_box=True), self.glosbe_scrapper.scrap_inflection)
 
     def scrap_grammar(self, lang: str, word: str) -> Outcome:
-        return Outcome(
-            kind=OutcomeKinds.GRAMAMR,
-            args=(args := Box(lang=lang, word=word, frozen_box=True)),
-            results=self.glosbe_scrapper.scrap_grammar(**args)
-        )
+        return self._scrap_cached(OutcomeKinds.GRAMAMR, Box(lang=lang, word=word, frozen_box=True), self.glosbe_scrapper.scrap_grammar)
 
     def scrap_main_translations(self, from_lang: str, to_lang: str, word: str) -> Outcome:
-        return Outcome(
-            kind=OutcomeKinds.MAIN_TRANSLATION,
-            args=(args := Box(from_lang=from_lang, to_lang=to_lang, word=word, frozen_box=True)),
-            results=self.glosbe_scrapper.scrap_main_translations(**args)
-        )
+        return self._scrap_cached(OutcomeKinds.MAIN_TRANSLATION, Box(from_lang=from_lang, to_lang=to_lang, word=word, frozen_box=True), self.glosbe_scrapper.scrap_main_translations)
 
     def scrap_indirect_translations(self, from_lang: str, to_lang: str, word: str) -> Outcome:
-        return Outcome(
-            kind=OutcomeKinds.INDIRECT_TRANSLATION,
-            args=(args := Box(from_lang=from_lang, to_lang=to_lang, word=word, frozen_box=True)),
-            results=self.glosbe_scrapper.scrap_indirect_translations(**args)
-        )
+        return self._scrap_cached(OutcomeKinds.INDIRECT_TRANSLATION, Box(from_lang=from_lang, to_lang=to_lang, word=word, frozen_box=True), self.glosbe_scrapper.scrap_indirect_translations)
 
     def scrap_definitions(self, lang: str, word: str) -> Outcome:
-        return Outcome(
-            kind=OutcomeKinds.DEFINITION,
-            args=(args := Box(lang=lang, word=word, frozen_box=True)),
-            results=self.glosbe_scrapper.scrap_definition(**args)
-        )
+        return self._scrap_cached(OutcomeKinds.DEFINITION, Box(lang=lang, word=word, frozen_box=True), self.glosbe_scrapper.scrap_definition)
 
     def scrap_wiktio(self, lang: str, word: str) -> Outcome:
-        return Outcome(
-            kind=OutcomeKinds.WIKTIO,
-            args=(args := Box(lang=lang, word=word, frozen_box=True)),
-            results=self.wiktio_scrapper.scrap_wiktio_info(**args)
-        )
+        return self._scrap_cached(OutcomeKinds.WIKTIO, Box(lang=lang, word=word, frozen_box=True), self.wiktio_scrapper.scrap_wiktio_info)
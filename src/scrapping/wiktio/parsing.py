@@ -8,6 +8,7 @@ from urllib.parse import unquote
 from pydash import chain as c
 
 import pydash as _
+import soupsieve as sv
 from bs4 import PageElement, NavigableString
 from bs4.element import Tag
 from more_itertools import split_before, last, split_at
@@ -48,7 +49,34 @@ class WiktioResult(Result, Meaning):
     def meanings(self) -> list[Meaning]:
         return _.flatten(self.structed_meanings)
 
+
+@dataclass(frozen=True)
+class EtymologyTrail:
+    """
+    The pages an etymology went through and how many further ones it may still look up
+    """
+    depth: int
+    pages: tuple[tuple[str, str], ...] = field(default=(), compare=False)  # Equal lookups share their results regardless of the way
+
+    @classmethod
+    def get_page(cls, word: str, lang: str) -> tuple[str, str]:
+        return word, WiktioParser.code_to_wiki.get(lang, lang)
+
+    def through(self, word: str, lang: str) -> EtymologyTrail:
+        return replace(self, pages=(*self.pages, self.get_page(word, lang)))
+
+    def further(self) -> EtymologyTrail:
+        return replace(self, depth=self.depth - 1)
+
+    def allows(self, word: str, lang: str) -> bool:
+        return self.depth > 0 and self.get_page(word, lang) not in self.pages
+
+
 class WiktioParser(Parser):
+    version: str = '1'
+    _main_selector = sv.compile('div.mw-content-ltr.mw-parser-output')
+    _qualifier_selector = sv.compile('span.ib-content.qualifier-content')
+    _ipa_selector = sv.compile('span.IPA:not(ul ul span.IPA)')
     code_to_wiki: dict = {code: ''.join(last(split_before(descr.split(',')[0], str.isupper, maxsplit=1)))
                           for code, descr in supported_languages.items()}
 
@@ -62,7 +90,7 @@ class WiktioParser(Parser):
 
     @classmethod
     def _get_target_section_batches(cls, tag: Tag, lang: str) -> dict[str, list[PageElement]]:
-        main = tag.select_one('div.mw-content-ltr.mw-parser-output')
+        main = cls._main_selector.select_one(tag)
         lang_batches = list(cls._split_for_class(main, 'mw-heading2'))
         target_lang_batch = next(cls._filter_for_firsts(lang_batches, cls.code_to_wiki.get(lang, lang).__eq__))
         section_batches = cls._split_for_class(target_lang_batch, 'mw-heading')
@@ -90,7 +118,7 @@ class WiktioParser(Parser):
 
     @classmethod
     @with_ensured_tag
-    def parse(cls, tag: Tag | str, lang: str, adapter: WiktioScrapAdapter) -> WiktioResult | ParsingException:
+    def parse(cls, tag: Tag | str, lang: str, adapter: WiktioScrapAdapter, trail: EtymologyTrail = EtymologyTrail(0)) -> WiktioResult | ParsingException:
         # TODO: Norwegian "land" -- "imperative of lande" is not parsed
         # TODO: Norwegian "like" -- etymology problem
         # TODO: es "diapositiva" -- etymology is css features as text
@@ -98,12 +126,34 @@ class WiktioParser(Parser):
             section_dict = cls._get_target_section_batches(tag, lang)
         except StopIteration:
             return ParsingException(f'Lang "{lang}" does not have word')
-        result = cls._major_parse(section_dict, lang, adapter)
+        prefetches = adapter.prefetch_etymology_sources(cls._get_inherited_sources(section_dict), trail)
+        try:
+            result = cls._major_parse(section_dict, lang, adapter, trail)
+        finally:
+            adapter.cancel_prefetches(prefetches)
         result = cls._postprocess(result)
         return result
 
     @classmethod
-    def _major_parse(cls, section_dict: dict[str, list[PageElement]], lang: str, adapter: WiktioScrapAdapter) -> WiktioResult:
+    def _get_inherited_sources(cls, section_dict: dict[str, list[PageElement]]) -> list[tuple[str, str]]:
+        """
+        The pages the etymologies are likely to continue at, to be looked up while the rest gets parsed
+        """
+        sources = []
+        for key, section in section_dict.items():
+            if not key.startswith('Etymology'):
+                continue
+            content = next((tag for tag in section if tag.name == 'p' and tag.text), None)
+            if content is None or 'Inherited from' not in content.text:
+                continue
+            try:
+                sources.append(cls._get_inherited_source(content))
+            except (StopIteration, AttributeError, KeyError, ValueError):  # Left for the parsing to fail on
+                continue
+        return sources
+
+    @classmethod
+    def _major_parse(cls, section_dict: dict[str, list[PageElement]], lang: str, adapter: WiktioScrapAdapter, trail: EtymologyTrail) -> WiktioResult:
         result = WiktioResult()
         under_surf_mapping = asdict(SurfacingEquivalents())
         for surf, section in section_dict.items():
@@ -115,7 +165,7 @@ class WiktioParser(Parser):
                 meanings.append([])
             if len(submeanings := meanings[major - 1]) < minor:
                 submeanings.append(replace(submeanings[minor - 2]) if submeanings else Meaning())
-            submeanings[minor - 1] = cls._parse_section(under, submeanings[minor - 1], section, lang, adapter)
+            submeanings[minor - 1] = cls._parse_section(under, submeanings[minor - 1], section, lang, adapter, trail)
         return result
 
     @classmethod
@@ -123,9 +173,9 @@ class WiktioParser(Parser):
         return {key: section for key, section in section_dict.items() if any(key.startswith(form) for form in surf_forms)}
 
     @classmethod
-    def _parse_section(cls, kind: str, dc: Meaning | WiktioResult, section: list[PageElement], lang: str, adapter: WiktioScrapAdapter) -> Meaning | WiktioResult:
+    def _parse_section(cls, kind: str, dc: Meaning | WiktioResult, section: list[PageElement], lang: str, adapter: WiktioScrapAdapter, trail: EtymologyTrail) -> Meaning | WiktioResult:
         parse = getattr(cls, f'_parse_{kind}')
-        return parse(dc, section, lang, adapter)
+        return parse(dc, section, lang, adapter, trail)
 
     @classmethod
     def _parse_pos(cls, dc: Meaning | WiktioResult, section: list[PageElement], *args, **kwargs) -> Meaning | WiktioResult:
@@ -142,7 +192,7 @@ class WiktioParser(Parser):
 
     @classmethod
     def _parse_pronunciation(cls, dc: Meaning | WiktioResult, section: list[PageElement], *args, **kwargs) -> Meaning | WiktioResult:
-        pronunciation_tags = [(tag.select_one('span.ib-content.qualifier-content'), tag.select('span.IPA:not(ul ul span.IPA)'))
+        pronunciation_tags = [(cls._qualifier_selector.select_one(tag), cls._ipa_selector.select(tag))
                           for tag in list(cls.filter_to_tags(section))[1] if 'IPA' in tag.text]
         pronunciations = [Pronunciation(name=name_tag.text if name_tag else None, ipas=[ipa_tag.text for ipa_tag in ipa_tags])
                           for name_tag, ipa_tags in pronunciation_tags]
@@ -150,7 +200,7 @@ class WiktioParser(Parser):
         return dc
 
     @classmethod
-    def _parse_etymology(cls, dc: Meaning | WiktioResult, section: list[PageElement], lang: str, adapter: WiktioScrapAdapter, *args, **kwargs) -> Meaning | WiktioResult:
+    def _parse_etymology(cls, dc: Meaning | WiktioResult, section: list[PageElement], lang: str, adapter: WiktioScrapAdapter, trail: EtymologyTrail, *args, **kwargs) -> Meaning | WiktioResult:
         section_it = list(section)  # Has to be "iter"
         content = next((tag for tag in section_it if tag.name == 'p' and tag.text), None)  # Cognate is later
         if not content and isinstance(section, Tag):
@@ -169,22 +219,13 @@ class WiktioParser(Parser):
         possibilities_section = next((tag for tag in section_it if tag.name == 'ul' and tag.text), None)
         if possibilities_section:  # TODO: A simplified unordered way
             li_tags = [tag for tag in possibilities_section.children if tag.name == 'li']
-            pot_etymologies = [cls._parse_etymology(dc, li_tag, lang, adapter) for li_tag in li_tags]
+            pot_etymologies = [cls._parse_etymology(dc, li_tag, lang, adapter, trail) for li_tag in li_tags]
             etymology_chain.extend(_.flat_map(pot_etymologies, c().get('etymology')))
 
         if f'Inherited from' in _.get(etymology_chain, -1, ''):
             # TODO: test further scrapping
-            from .scrap_adapting import WiktioScrapAdapter
-            last_tag = next((elem for elem in reversed(list(content.children)) if isinstance(elem, Tag) and elem.name != 'span'))
-            href = last_tag.next.attrs['href']
-            further_word, further_lang = re.split('[#/]', href.removeprefix('/wiki/').removeprefix('/w/'))
-            further_word = (further_word or last_tag.text).split('=')[-1]
-            further_lang = further_lang.split(':')[0].removeprefix('#').split('&')[0]
-            if further_word.startswith(RECONSTRUCTION:='Reconstruction:'):
-                further_word, further_lang = further_lang, further_word
-                further_word = f'{further_lang}/{further_word}'  # It's intuitive, but it's the equivalent of how wiktionary structures it
-                further_lang = further_lang.removeprefix(RECONSTRUCTION)
-            result: WiktioResult | ParsingException = adapter.scrap_wiktio_info(unquote(further_word), further_lang.replace('_', ' '))
+            further_word, further_lang = cls._get_inherited_source(content)
+            result = adapter.scrap_etymology_source(further_word, further_lang, trail) if trail.allows(further_word, further_lang) else None
             if isinstance(result, WiktioResult):
                 meaninigs: list[Meaning] = result.etymology or result.structed_meanings[0] if len(result.structed_meanings) else []
                 further_etymologies = meaninigs[0].etymology
@@ -192,6 +233,19 @@ class WiktioParser(Parser):
         dc = replace(dc, etymology=[sent.replace('  ', ' ') for sent in etymology_chain])
         return dc
 
+    @classmethod
+    def _get_inherited_source(cls, content: Tag) -> tuple[str, str]:
+        last_tag = next((elem for elem in reversed(list(content.children)) if isinstance(elem, Tag) and elem.name != 'span'))
+        href = last_tag.next.attrs['href']
+        further_word, further_lang = re.split('[#/]', href.removeprefix('/wiki/').removeprefix('/w/'))
+        further_word = (further_word or last_tag.text).split('=')[-1]
+        further_lang = further_lang.split(':')[0].removeprefix('#').split('&')[0]
+        if further_word.startswith(RECONSTRUCTION:='Reconstruction:'):
+            further_word, further_lang = further_lang, further_word
+            further_word = f'{further_lang}/{further_word}'  # It's intuitive, but it's the equivalent of how wiktionary structures it
+            further_lang = further_lang.removeprefix(RECONSTRUCTION)
+        return unquote(further_word), further_lang.replace('_', ' ')
+
     @classmethod
     def _postprocess(cls, result: WiktioResult) -> WiktioResult:
         # TODO: Reformat based on the same fields within the structed_meanings
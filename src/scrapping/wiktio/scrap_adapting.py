@@ -1,32 +1,133 @@
-from dataclasses import replace
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Iterable, Optional
 
 from box import Box
 from requests import HTTPError, Response
 
-from .parsing import WiktioParser, WiktioResult
+from .parsing import EtymologyTrail, WiktioParser, WiktioResult
 from .web_building import WiktioUrlBuilder
-from ..core.parsing import ParsingException, Result
+from ...constants import ScrapConstants
+from ..core.caching import ResultCache
+from ..core.parsing import ParsingException, Result, query_html_parser
 from ..core.scrap_adapting import ScrapAdapter
 
 
 class WiktioScrapAdapter(ScrapAdapter):
-    def scrap_wiktio_info(self, word: str, lang: str) -> list[Result] | HTTPError | Exception:
+    """
+    Looks up the page's section index first to fetch only the section of the requested language
+    """
+    warm_up_urls = (WiktioUrlBuilder.API_URL,)
+
+    def __init__(self, *args, etymology_depth: int = ScrapConstants.ETYMOLOGY_DEPTH, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.etymology_depth = etymology_depth
+        self.etymology_memo = ResultCache(max_memory_entries=ScrapConstants.MAX_ETYMOLOGY_MEMO_ENTRIES)
+
+    @cached_property
+    def etymology_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=ScrapConstants.MAX_ETYMOLOGY_WORKERS, thread_name_prefix='etymology')
+
+    def scrap_wiktio_info(self, word: str, lang: str, trail: EtymologyTrail = None) -> list[Result] | HTTPError | Exception:
+        url = WiktioUrlBuilder.API_URL
+        section_indexes = self.scrap(url, self._parse_section_indexes, params=self._get_section_index_params(word))
+        if isinstance(section := self._get_section(section_indexes, word, lang), Exception):
+            return section
+        results = self.scrap(url, self._wrap_parser(word, lang, trail), params=self._get_params(word, section))
+        return results
+
+    def scrap_etymology_source(self, word: str, lang: str, trail: EtymologyTrail) -> WiktioResult | HTTPError | Exception:
+        """
+        Looks up the page an etymology continues at, each at most once for the same remaining depth
+        """
+        args = {'word': word, 'lang': EtymologyTrail.get_page(word, lang)[1], 'depth': str(trail.depth)}
+        version = f'{WiktioParser.version}/{query_html_parser.get()}'
+        if (result := self.etymology_memo.load('etymology', args, version)) is not None:
+            return result
+        if isinstance(result := self.scrap_wiktio_info(word, lang, trail.further()), WiktioResult):
+            self.etymology_memo.save('etymology', args, version, result)
+        return result
+
+    def prefetch_etymology_sources(self, sources: Iterable[tuple[str, str]], trail: EtymologyTrail) -> list[Future]:
+        """
+        Starts looking up the independent sources at once, the parsing then joins the lookups in flight
+        """
+        sources = [(word, lang) for word, lang in dict.fromkeys(sources) if trail.allows(word, lang)]
+        if len(sources) < 2:  # Nothing to overlap with
+            return []
+        return [self.etymology_executor.submit(copy_context().run, self.scrap_etymology_source, word, lang, trail) for word, lang in sources]
+
+    @classmethod
+    def cancel_prefetches(cls, prefetches: Iterable[Future]) -> None:
+        for prefetch in prefetches:
+            prefetch.cancel()
+
+    @classmethod
+    def _get_section(cls, section_indexes: Optional[dict[str, str]] | Exception, word: str, lang: str) -> Optional[str] | Exception:
+        """
+        :return: the index of the lang's section, None for the whole page if there's no section index
+        """
+        if section_indexes is None or isinstance(section_indexes, Exception):
+            return section_indexes
+        if (section := section_indexes.get(WiktioParser.code_to_wiki.get(lang, lang))) is None:
+            return ParsingException(f'Lang "{lang}" does not have word "{word}"')
+        return section
+
+    @classmethod
+    def _parse_section_indexes(cls, response: Response) -> Optional[dict[str, str]] | ParsingException:
+        page = Box(response.json(), default_box=True)
+        if page.error:
+            return ParsingException(page.error.info + f': "{response.url}"')
+        if 'sections' not in page.parse:  # Answered with the whole page instead
+            return None
+        return {section.line: section.index for section in page.parse.sections if section.level == '2'}
+
+    @classmethod
+    def _get_section_index_params(cls, word: str) -> dict[str, str]:
+        return {
+            'action': 'parse',
+            'page': word.replace(' ', '_'),
+            'format': 'json',
+            'prop': 'sections',
+        }
+
+    @classmethod
+    def _get_params(cls, word: str, section: str = None) -> dict[str, str]:
         params = {
             'action': 'parse',
             'page': word.replace(' ', '_'),
             'format': 'json',
             'prop': 'text',
+            'disableeditsection': '1',
+            'disablelimitreport': '1',
         }
-        url = WiktioUrlBuilder.API_URL
-        results = self.scrap(url, self._wrap_parser(word, lang), params=params)
-        return results
+        if section is not None:
+            params['section'] = section
+        return params
+
+    def _wrap_parser(self, word: str, lang: str, trail: EtymologyTrail = None) -> WiktioPageParse:
+        trail = trail or EtymologyTrail(self.etymology_depth)
+        return WiktioPageParse(word, lang, self, trail.through(word, lang))
+
+
+@dataclass(frozen=True)
+class WiktioPageParse:
+    """
+    Comparable, so that the same lookups get coalesced
+    """
+    word: str
+    lang: str
+    adapter: WiktioScrapAdapter
+    trail: EtymologyTrail
 
-    def _wrap_parser(self, word: str, lang: str):
-        def parse(response: Response) -> WiktioResult | Exception:
-            page = Box(response.json(), default_box=True)
-            if page.error:
-                return ParsingException(page.error.info + f': "{response.url}"')
-            match result := WiktioParser.parse(page.parse.text['*'], lang, self):
-                case WiktioResult(): return replace(result, word=word)
-                case ParsingException(): return ParsingException(result.args[0] + f' "{word}"')
-        return parse
+    def __call__(self, response: Response) -> WiktioResult | Exception:
+        page = Box(response.json(), default_box=True)
+        if page.error:
+            return ParsingException(page.error.info + f': "{response.url}"')
+        match result := WiktioParser.parse(page.parse.text['*'], self.lang, self.adapter, self.trail):
+            case WiktioResult(): return replace(result, word=self.word)
+            case ParsingException(): return ParsingException(result.args[0] + f' "{self.word}"')
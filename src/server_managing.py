@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Callable
+from urllib.parse import parse_qsl, urlsplit
+
+from src.constants import ServerConstants
+from src.scrapping import ScrapMgr, Outcome
+from src.scrapping.core.coalescing import SingleFlight
+from src.scrapping.outcome import OutcomeKinds
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """
+    Handles the connections on a fixed pool of workers instead of a thread each
+    """
+    def __init__(self, server_address: tuple[str, int], handler: type[BaseHTTPRequestHandler], workers: int):
+        super().__init__(server_address, handler)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='server')
+
+    def process_request(self, request, client_address) -> None:
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ServerRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keeping the connections alive
+    timeout = ServerConstants.KEEP_ALIVE  # Not to hold a worker for an idle connection
+    server: PooledHTTPServer
+
+    def do_GET(self) -> None:
+        self.server.server_mgr.handle(self)
+
+    def reply(self, status: HTTPStatus, body: dict, headers: dict = None) -> None:
+        content = json.dumps(body, ensure_ascii=False, default=Outcome.to_jsonable).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        for key, val in (headers or {}).items():
+            self.send_header(key, str(val))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        logging.debug(f'{self.address_string()} {format % args}')
+
+
+class ServerMgr:
+    """
+    Serves the lookups as JSON over HTTP, e.g. GET /translation?from_lang=de&to_lang=en&word=Frau.
+    The identical requests in flight share one lookup and each client has only so many of them at once
+    """
+    def __init__(self, scrap_mgr: ScrapMgr,
+                 host: str = ServerConstants.HOST,
+                 port: int = 0,
+                 workers: int = ServerConstants.WORKERS,
+                 client_limit: int = ServerConstants.CLIENT_LIMIT,
+        ):
+        """
+        :param port: 0 for any free one
+        """
+        self.scrap_mgr = scrap_mgr
+        self.client_limit = client_limit
+        self.lookups: dict[str, Callable[..., Outcome]] = {
+            f'/{OutcomeKinds.MAIN_TRANSLATION}': scrap_mgr.scrap_main_translations,
+            f'/{OutcomeKinds.INDIRECT_TRANSLATION}': scrap_mgr.scrap_indirect_translations,
+            f'/{OutcomeKinds.INFLECTION}': scrap_mgr.scrap_inflections,
+            f'/{OutcomeKinds.GRAMAMR}': scrap_mgr.scrap_grammar,
+            f'/{OutcomeKinds.DEFINITION}': scrap_mgr.scrap_definitions,
+            f'/{OutcomeKinds.WIKTIO}': scrap_mgr.scrap_wiktio,
+        }
+        self.params = {path: list(inspect.signature(lookup).parameters) for path, lookup in self.lookups.items()}
+        self.flights = SingleFlight('Server lookups')
+        self.in_flight: dict[str, int] = {}
+        self._lock = Lock()
+        self.server = PooledHTTPServer((host, port), ServerRequestHandler, workers)
+        self.server.server_mgr = self
+
+    @property
+    def address(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def serve(self) -> None:
+        logging.info(f'Serving {", ".join(self.lookups)} on {self.address}')
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            logging.debug(f'{self.flights.saved} of {self.flights.calls} lookups saved by coalescing')
+
+    def shutdown(self) -> None:
+        self.server.shutdown()
+
+    def handle(self, handler: ServerRequestHandler) -> None:
+        url = urlsplit(handler.path)
+        if url.path == '/':
+            return handler.reply(HTTPStatus.OK, {'endpoints': self.params})
+        if (lookup := self.lookups.get(url.path)) is None:
+            return handler.reply(HTTPStatus.NOT_FOUND, {'error': f'No such endpoint, expected one of {list(self.lookups)}'})
+        query = dict(parse_qsl(url.query))
+        if missing := [param for param in self.params[url.path] if not query.get(param)]:
+            return handler.reply(HTTPStatus.BAD_REQUEST, {'error': f'Missing {", ".join(missing)}'})
+        client = handler.headers.get(ServerConstants.CLIENT_HEADER) or handler.client_address[0]
+        if not self._try_admit(client):
+            return handler.reply(HTTPStatus.TOO_MANY_REQUESTS, {'error': f'Over {self.client_limit} requests at once'}, {'Retry-After': ServerConstants.RETRY_AFTER})
+        try:
+            args = [query[param] for param in self.params[url.path]]
+            outcome = self.flights.do((url.path, *args), lookup, *args)
+        except Exception as e:
+            logging.exception(e)
+            return handler.reply(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+        finally:
+            self._leave(client)
+            self.flights.forget()
+            self.scrap_mgr.forget_flights()
+        handler.reply(HTTPStatus.OK, outcome.to_record())
+
+    def _try_admit(self, client: str) -> bool:
+        with self._lock:
+            if self.in_flight.get(client, 0) >= self.client_limit:
+                return False
+            self.in_flight[client] = self.in_flight.get(client, 0) + 1
+            return True
+
+    def _leave(self, client: str) -> None:
+        with self._lock:
+            self.in_flight[client] -= 1
+            if not self.in_flight[client]:
+                del self.in_flight[client]
@@ -15,7 +15,9 @@ def main():
             conf_path=Paths.CONF_FILE,
             valid_data_file=Paths.VALID_DATA_FILE,
             short_mem_file=Paths.SHORT_MEM_FILE,
-            lang_script_file=Paths.LANG_SCRIPT_FILE
+            lang_script_file=Paths.LANG_SCRIPT_FILE,
+            response_cache_dir=Paths.RESPONSE_CACHE_DIR,
+            result_cache_dir=Paths.RESULT_CACHE_DIR,
         ).run()
     except KeyboardInterrupt:
         pass
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark of the context's reads, iterated args and a full printing of the outcomes, e.g.
+    python -m testing.benchmarks.context_bench --words 20 --repeat 20
+"""
+import sys
+import timeit
+import warnings
+from argparse import ArgumentParser
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.conf import Conf
+from src.context import Context
+from src.printer import Printer
+from src.scrapping import ScrapMgr
+from testing.proj.mocking import mocked_scrap
+
+LANGS = ['de', 'en', 'pl', 'es', 'fr', 'it']
+
+
+def create_context(n_words: int, n_to_langs: int) -> Context:
+    context = Context(Conf(langs=LANGS))
+    context.update(from_langs=['de'], to_langs=LANGS[1:1 + n_to_langs], words=[f'Wort{i}' for i in range(n_words)])
+    return context
+
+
+def read_context(context: Context) -> None:
+    for _ in range(100):
+        context.groupby, context.indirect, context.color, context.inflection, context.words, context.to_langs
+
+
+def iterate_args(context: Context) -> None:
+    for scrap_it in context.iterate_args():
+        scrap_it.is_first_in_poly_main_group(), scrap_it.is_first_in_poly_subgroup(), scrap_it.main_group, scrap_it.subgroup
+        scrap_it.is_at_inflection(), scrap_it.is_at_grammar(), scrap_it.is_at_translation(), scrap_it.is_at_wiktio()
+
+
+def print_outcomes(printer: Printer, outcomes: list) -> None:
+    for outcome in outcomes:
+        printer.print_result(outcome)
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Micro-benchmark of the context')
+    parser.add_argument('--words', type=int, default=20, help='Words to iterate the args of')
+    parser.add_argument('--to-langs', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')  # As the app does, for the conf's unset fields
+
+    context = create_context(args.words, args.to_langs)
+    page_context = Context(Conf(langs=LANGS))
+    page_context.update(from_langs=['de'], to_langs=['en', 'pl'], words=['Frau', 'Herr'], wiktio=True, inflection=True)
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=mocked_scrap):
+        outcomes = list(ScrapMgr().scrap(page_context.snapshot()))
+    printer = Printer(page_context.snapshot(), printer=lambda *args, **kwargs: None)
+
+    benchmarks = {
+        '600 context reads': lambda: read_context(context),
+        'context update': lambda: context.update(groupby='word', inflection=False),
+        f'iterate_args of {args.words} words to {args.to_langs} langs': lambda: iterate_args(context),
+        f'printing {len(outcomes)} outcomes': lambda: print_outcomes(printer, outcomes),
+    }
+    for name, benchmark in benchmarks.items():
+        best = min(timeit.repeat(benchmark, number=1, repeat=args.repeat))
+        print(f'{name:<40} {best * 1e3:8.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Load test of the JSON API against the local replay of the testing pages, e.g.
+    python -m testing.load.serving_load --clients 8 --requests 50 --latency .1
+"""
+import random
+import statistics
+import sys
+import threading
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.constants import ServerConstants
+from src.scrapping import ScrapMgr
+from src.server_managing import ServerMgr
+from testing.proj.replaying import ReplayServer
+
+QUERIES = [
+    ('/translation', {'from_lang': 'de', 'to_lang': 'en', 'word': 'Frau'}),
+    ('/translation', {'from_lang': 'de', 'to_lang': 'en', 'word': 'Herr'}),
+    ('/translation', {'from_lang': 'de', 'to_lang': 'pl', 'word': 'Frau'}),
+    ('/translation', {'from_lang': 'pl', 'to_lang': 'en', 'word': 'kobieta'}),
+    ('/translation', {'from_lang': 'en', 'to_lang': 'pl', 'word': 'water'}),
+    ('/inflection', {'lang': 'de', 'word': 'Frau'}),
+    ('/inflection', {'lang': 'de', 'word': 'Herr'}),
+    ('/wiktio', {'lang': 'de', 'word': 'Frau'}),
+    ('/wiktio', {'lang': 'en', 'word': 'water'}),
+    ('/wiktio', {'lang': 'es', 'word': 'conocer'}),
+]
+
+
+def run_client(address: str, name: str, n_requests: int, latencies: list[float], statuses: Counter, lock: threading.Lock) -> None:
+    with requests.Session() as session:
+        session.headers[ServerConstants.CLIENT_HEADER] = name
+        for _ in range(n_requests):
+            path, params = random.choice(QUERIES)
+            while True:
+                started_at = time.monotonic()
+                response = session.get(f'{address}{path}', params=params)
+                with lock:
+                    statuses[response.status_code] += 1
+                if response.status_code != 429:
+                    break
+                time.sleep(float(response.headers.get('Retry-After', ServerConstants.RETRY_AFTER)))
+            with lock:
+                latencies.append(time.monotonic() - started_at)
+
+
+@dataclass
+class LoadReport:
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    elapsed: float = 0.
+    upstream_requests: int = 0
+    coalesced: int = 0
+    lookups: int = 0
+
+    @property
+    def server_errors(self) -> int:
+        return sum(count for status, count in self.statuses.items() if status >= 500)
+
+    def __str__(self) -> str:
+        quantiles = statistics.quantiles(self.latencies, n=100)
+        return '\n'.join([
+            f'{len(self.latencies)} requests in {self.elapsed:.2f}s ({len(self.latencies) / self.elapsed:.1f}/s)',
+            f'latency p50 {quantiles[49] * 1000:.0f}ms, p95 {quantiles[94] * 1000:.0f}ms, p99 {quantiles[98] * 1000:.0f}ms',
+            f'statuses {dict(self.statuses)}',
+            f'{self.upstream_requests} upstream requests, {self.coalesced} of {self.lookups} lookups coalesced',
+        ])
+
+
+def run_load(clients: int, threads: int, n_requests: int, latency: float,
+             workers: int = ServerConstants.WORKERS,
+             client_limit: int = ServerConstants.CLIENT_LIMIT,
+    ) -> LoadReport:
+    report, lock = LoadReport(), threading.Lock()
+    with ReplayServer(latency=latency) as replay:
+        scrap_mgr = ScrapMgr(session=replay.create_session())
+        server_mgr = ServerMgr(scrap_mgr, workers=workers, client_limit=client_limit)
+        threading.Thread(target=server_mgr.serve, name='server', daemon=True).start()
+        client_threads = [
+            threading.Thread(target=run_client, args=(server_mgr.address, f'client-{i}', n_requests, report.latencies, report.statuses, lock))
+            for i in range(clients) for _ in range(threads)
+        ]
+        started_at = time.monotonic()
+        for thread in client_threads:
+            thread.start()
+        for thread in client_threads:
+            thread.join()
+        report.elapsed = time.monotonic() - started_at
+        server_mgr.shutdown()
+    report.upstream_requests = replay.requests
+    report.coalesced, report.lookups = server_mgr.flights.saved, server_mgr.flights.calls
+    return report
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Load test of the JSON API, failing on any server error')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--threads', type=int, default=2, help='Threads per client')
+    parser.add_argument('--requests', type=int, default=50, help='Requests per thread')
+    parser.add_argument('--latency', type=float, default=.1, help='Of the replayed hosts, in seconds')
+    parser.add_argument('--workers', type=int, default=ServerConstants.WORKERS)
+    parser.add_argument('--client-limit', type=int, default=ServerConstants.CLIENT_LIMIT)
+    args = parser.parse_args()
+
+    report = run_load(args.clients, args.threads, args.requests, args.latency, args.workers, args.client_limit)
+    print(report)
+    if report.server_errors:
+        sys.exit(f'{report.server_errors} server errors')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ from requests import HTTPError, Response
 from src.scrapping.core.parsing import Result, ParsingException
 
 PAGES = Path(__file__).parent.parent / 'pages'
+SECTIONS = Path(__file__).parent.parent / 'sections'  # The wiktio section indexes and the sections of the langs
 
 class PageNotFound(FileNotFoundError):
     pass
@@ -23,6 +24,20 @@ def mocked_scrap(url: str, parse: Callable[[Response | Tag | str], list[Result]
     return parse(load_file(path))
 
 
+def mocked_sectioned_scrap(url: str, parse: Callable[[Response | Tag | str], list[Result] | ParsingException | HTTPError], params=None, header=None) -> list[Result] | HTTPError | ParsingException:
+    """
+    Answers with the saved section index or section, or with the whole page as mocked_scrap if there's none saved
+    """
+    if 'wiktio' in url and (path := SECTIONS / get_section_filename(params)).exists():
+        return parse(load_file(path))
+    return mocked_scrap(url, parse, params, header)
+
+
+def get_section_filename(params: dict[str, Any]) -> str:
+    part = 'sections' if params.get('prop') == 'sections' else params.get('section', '')
+    return f'wiktio-{params["page"]}-{part}.json'
+
+
 def get_filename_from_url(url: str, params: dict[str, Any]) -> str:
     site = _.filter_({'glosbe', 'wiktio'}, url.__contains__)[0]
     arguments = []
@@ -0,0 +1,97 @@
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from requests import PreparedRequest, Session
+from requests.adapters import HTTPAdapter
+
+from testing.proj.mocking import PAGES, get_filename_from_url
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Answers with the saved page of the original url, given as the path, e.g. /glosbe.com/de/en/Frau
+    """
+    protocol_version = 'HTTP/1.1'
+    server: 'ReplayServer'
+
+    def do_GET(self) -> None:
+        self.server.count()
+        time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        try:
+            path = PAGES / get_filename_from_url(f'https:/{unquote(url.path)}', dict(parse_qsl(url.query)))
+        except (IndexError, KeyError, ValueError):
+            path = None
+        if path is None or not path.exists():
+            return self._reply(HTTPStatus.NOT_FOUND, b'', 'text/plain')
+        content_type = 'application/json' if path.name.startswith('wiktio') else 'text/html'
+        self._reply(HTTPStatus.OK, path.read_bytes(), f'{content_type}; charset=utf-8')
+
+    def do_HEAD(self) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _reply(self, status: HTTPStatus, content: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    A local stand-in for Glosbe and Wiktionary replaying the testing pages, with the latency of a real host
+    """
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.):
+        super().__init__(('127.0.0.1', 0), ReplayHandler)
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def address(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'ReplayServer':
+        threading.Thread(target=self.serve_forever, name='replay', daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def create_session(self) -> Session:
+        """
+        :return: a session sending the requests for any host to the replay
+        """
+        session = Session()
+        adapter = ReplayAdapter(self.address)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+
+class ReplayAdapter(HTTPAdapter):
+    def __init__(self, replay_address: str, **kwargs):
+        super().__init__(**kwargs)
+        self.replay_address = replay_address
+
+    def send(self, request: PreparedRequest, **kwargs):
+        url = urlsplit(request.url)
+        request.url = f'{self.replay_address}/{url.netloc}{url.path}' + (f'?{url.query}' if url.query else '')
+        return super().send(request, **kwargs)
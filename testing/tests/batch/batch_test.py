@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from contextlib import nullcontext
+from unittest import mock
+
+import pytest
+import yaml
+
+from src.app_managing import AppMgr
+from testing.proj.mocking import mocked_scrap
+
+
+def logged_scrap(url: str, *args, **kwargs):
+    logging.warning(f'Scrapping {url}')
+    return mocked_scrap(url, *args, **kwargs)
+
+
+@pytest.fixture
+def app_mgr(tmp_path) -> AppMgr:
+    conf_path = tmp_path / 'conf.yaml'
+    conf_path.write_text(yaml.safe_dump({'langs': ['de', 'en', 'pl'], 'gather_data': 'off'}))
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=logged_scrap), mock.patch('src.app_managing.AppMgr.connect', return_value=nullcontext(None)):
+        yield AppMgr(conf_path=conf_path, result_cache_dir=tmp_path / 'results', printer=lambda *args, **kwargs: None)
+
+
+def run_batch(app_mgr: AppMgr, tmp_path, lines: list[str], *args: str) -> None:
+    (words := tmp_path / 'words.txt').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    with mock.patch.object(sys, 'argv', ['translate.py', '--batch', str(words), *args]):
+        app_mgr.run_single()
+    app_mgr.run_batch(app_mgr.context.batch)
+
+
+def test_logs_kept_off_the_records(app_mgr, tmp_path, capsys):
+    run_batch(app_mgr, tmp_path, ['Frau', 'Herr', 'de pl Frau'], '-f', 'de', '-t', 'en')
+    out, err = capsys.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+    assert {record['args']['word'] for record in records} == {'Frau', 'Herr'}
+    assert 'Scrapping' in err
+
+
+def read_records(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_repeated_lines_written_without_resuming(app_mgr, tmp_path):
+    out = tmp_path / 'out.jsonl'
+    run_batch(app_mgr, tmp_path, ['Frau', 'Herr', 'Frau'], '-f', 'de', '-t', 'en', '-O', str(out))
+    queries = [record['query'] for record in read_records(out)]
+    assert queries.count('Frau') == 2 * queries.count('Herr') > 0
+
+
+def test_resumed_after_the_done_lines(app_mgr, tmp_path):
+    out = tmp_path / 'out.jsonl'
+    run_batch(app_mgr, tmp_path, ['Frau', 'Nichtswort'], '-f', 'de', '-t', 'en', '-O', str(out))
+    first = read_records(out)
+    with open(out, 'a', encoding='utf-8') as f:
+        f.write('{"torn by a crash')
+
+    run_batch(app_mgr, tmp_path, ['Frau', 'Nichtswort', 'Herr'], '-f', 'de', '-t', 'en', '-O', str(out), '--resume')
+    records = read_records(out)
+    assert records[:len(first)] == first
+    assert {record['query'] for record in first} == {'Frau', 'Nichtswort'}
+    assert {record['query'] for record in records[len(first):]} == {'Nichtswort', 'Herr'}
+
+
+def test_record_per_line_outcome(app_mgr, tmp_path, capsys):
+    run_batch(app_mgr, tmp_path, ['# a comment', 'Frau', '', 'de pl Frau', 'Nichtswort'], '-f', 'de', '-t', 'en')
+    out, err = capsys.readouterr()
+    records = sorted((json.loads(line) for line in out.splitlines()), key=lambda record: record['line'])  # Written as the lines get done
+
+    assert [(record['line'], record['ok']) for record in records] == [(2, True), (4, True), (5, False)]
+    assert (records[0]['args']['to_lang'], records[1]['args']['to_lang']) == ('en', 'pl')
+    assert '3 lines, 2 outcomes' in err and '1 failed lines' in err
@@ -0,0 +1,43 @@
+import gzip
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.resouce_managing.disk_cache import DiskCache
+
+ENTRY = os.urandom(100)  # Incompressible, so each entry takes the same space
+ENTRY_SIZE = len(gzip.compress(ENTRY))
+
+
+def create_cache(tmp_path: Path, n_entries: int) -> DiskCache:
+    return DiskCache(tmp_path, max_size=n_entries * ENTRY_SIZE)
+
+
+def test_least_recently_used_evicted(tmp_path: Path):
+    cache = create_cache(tmp_path, 2)
+    cache.put('a', ENTRY)
+    cache.put('b', ENTRY)
+    cache.get('a')
+    cache.put('c', ENTRY)
+
+    assert cache.get('a') == ENTRY
+    assert cache.get('b') is None
+    assert cache.get('c') == ENTRY
+
+
+def test_last_use_read_from_disk_once(tmp_path: Path):
+    previous = create_cache(tmp_path, 3)
+    for key in ('a', 'b', 'c'):
+        previous.put(key, ENTRY)
+    past = time.time() - 60
+    os.utime(previous._get_path('a'), (past, past))
+
+    cache = create_cache(tmp_path, 3)
+    cache.put('d', ENTRY)
+    with patch.object(Path, 'stat', side_effect=AssertionError('Stated on eviction')):
+        cache.put('e', ENTRY)
+
+    assert not cache._get_path('a').exists()
+    assert not cache._get_path('b').exists()
+    assert cache.get('c') == ENTRY
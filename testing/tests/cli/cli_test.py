@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from src.constants import Paths
+from src.input_managing.cli import AtSpecifierAction, CLI
+
+
+@pytest.mark.parametrize('args', [
+    ['Frau'],
+    ['de', 'en', 'Frau'],
+    ['de', 'en', 'pl', 'Frau', 'Herr'],
+    ['ksiądz', ''],
+])
+def test_positionals_parsed_as_by_argparse(args: list[str]):
+    assert CLI._parse_positionals(args) == CLI._parse_all(args)
+
+
+@pytest.mark.parametrize('args', [
+    ['Frau', '-i'],
+    ['-f', 'de', 'Frau'],
+    ['ksiądz', '--', 'pl'],
+])
+def test_options_left_to_argparse(args: list[str]):
+    assert CLI._parse_positionals(args) is None
+
+
+def test_defaults_not_shared_between_parses():
+    CLI._parse_all(['Frau', '-i']).to_langs.append('en')
+    CLI._parse_positionals(['Frau']).to_langs.append('en')
+    assert CLI._parse_all(['Frau', '-i']).to_langs == []
+    assert CLI._parse_positionals(['Frau']).to_langs == []
+
+
+def test_side_mode_fusions_saved_per_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(Paths, 'CLI_GRAMMAR_FILE', grammar_file := tmp_path / 'cli_grammar.json')
+    AtSpecifierAction.side_mode_fusions.cache_clear()
+    fusions = AtSpecifierAction.side_mode_fusions()
+    assert fusions == AtSpecifierAction._generate_side_mode_fusions()
+    assert json.loads(grammar_file.read_text())['fusions'] == fusions
+
+    grammar_file.write_text(json.dumps({**json.loads(grammar_file.read_text()), 'fusions': ['-fo']}))
+    AtSpecifierAction.side_mode_fusions.cache_clear()
+    assert AtSpecifierAction.side_mode_fusions() == ['-fo']
+
+    grammar_file.write_text(json.dumps({'source': 'outdated', 'fusions': ['-fo']}))
+    AtSpecifierAction.side_mode_fusions.cache_clear()
+    assert AtSpecifierAction.side_mode_fusions() == fusions
+    AtSpecifierAction.side_mode_fusions.cache_clear()
@@ -0,0 +1,34 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.conf import Conf
+from src.context import Context
+
+
+@pytest.fixture
+def context() -> Context:
+    context = Context(Conf(langs=['de', 'en', 'pl'], html_parser='html5lib'))
+    context.update(words=['Frau'], from_langs=['de'], to_langs=['en', 'pl'])
+    return context
+
+
+def test_snapshot_unaffected_by_next_ingestions(context):
+    snapshot = context.snapshot()
+
+    context.update(words=['Herr'], to_langs=['pl'])
+    context._conf.html_parser = 'lxml'
+
+    assert (snapshot.words, snapshot.to_langs, snapshot.html_parser) == (('Frau',), ('en', 'pl'), 'html5lib')
+    assert [scrap_it.args for scrap_it in snapshot.iterate_args()] == [('de', 'en', 'Frau'), ('de', 'pl', 'Frau')]
+
+
+def test_snapshot_frozen(context):
+    snapshot = context.snapshot()
+
+    with pytest.raises(FrozenInstanceError):
+        snapshot.words = ['Herr']
+    with pytest.raises(TypeError):
+        snapshot._own['words'] = ('Herr',)
+    assert snapshot.snapshot() is snapshot
+
@@ -0,0 +1,55 @@
+import os
+import socket
+import stat
+from socketserver import UnixStreamServer
+from unittest import mock
+
+import pytest
+
+from src.daemon_managing import DaemonMgr
+from src.exceptions import InvalidExecution
+
+
+def test_socket_bound_for_the_owner_only(tmp_path):
+    modes = []
+    bind = UnixStreamServer.server_bind
+
+    def checked_bind(server: UnixStreamServer) -> None:
+        bind(server)
+        modes.append(stat.S_IMODE(os.stat(server.server_address).st_mode))
+
+    daemon_mgr = DaemonMgr(mock.Mock(), tmp_path / 'daemon.sock')
+    umask = os.umask(0o022)
+    try:
+        with mock.patch.object(UnixStreamServer, 'server_bind', checked_bind), mock.patch.object(UnixStreamServer, 'serve_forever'):
+            daemon_mgr.serve()
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    assert modes == [0o600]
+
+
+def test_socket_dir_made_for_the_owner_only(tmp_path):
+    daemon_mgr = DaemonMgr(mock.Mock(), tmp_path / 'run' / 'daemon.sock')
+    with mock.patch.object(UnixStreamServer, 'serve_forever'):
+        daemon_mgr.serve()
+    assert stat.S_IMODE(os.stat(tmp_path / 'run').st_mode) == 0o700
+
+
+def test_other_users_socket_neither_connected_nor_removed(tmp_path):
+    socket_path = tmp_path / 'daemon.sock'
+    socket_path.touch()
+    with mock.patch('src.daemon_managing.os.getuid', return_value=os.getuid() + 1), \
+            mock.patch.object(socket.socket, 'connect') as connect:
+        assert not DaemonMgr.is_running(socket_path)
+        with pytest.raises(InvalidExecution):
+            DaemonMgr(mock.Mock(), socket_path).serve()
+    connect.assert_not_called()
+    assert socket_path.exists()
+
+
+def test_socket_without_access_not_running(tmp_path):
+    socket_path = tmp_path / 'daemon.sock'
+    socket_path.touch()
+    with mock.patch.object(socket.socket, 'connect', side_effect=PermissionError):
+        assert not DaemonMgr.is_running(socket_path)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from unittest import mock
+
+import pytest
+import yaml
+
+from src.app_managing import AppMgr
+from testing.proj.mocking import mocked_scrap
+
+ARGS = ['Frau', '-f', 'de', '-t', 'en']
+
+
+@pytest.fixture
+def gather() -> mock.Mock:
+    with mock.patch('src.resouce_managing.valid_data.ValidDataMgr.gather', return_value=False) as gather:
+        yield gather
+
+
+@pytest.fixture
+def create_app_mgr(tmp_path, gather):
+    conf_path = tmp_path / 'conf.yaml'
+    conf_path.write_text(yaml.safe_dump({'langs': ['de', 'en'], 'gather_data': 'all'}))
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=mocked_scrap), mock.patch('src.app_managing.AppMgr.connect', return_value=nullcontext(None)):
+        yield lambda: AppMgr(conf_path=conf_path, valid_data_file=tmp_path / 'valid_data.csv', result_cache_dir=tmp_path / 'results', printer=lambda *args, **kwargs: None)
+
+
+def get_gathered_words(gather: mock.Mock) -> list[str]:
+    return [outcome.args.word for call in gather.call_args_list for outcome in call.args[0]]
+
+
+def test_cached_results_not_gathered_again(create_app_mgr, gather):
+    create_app_mgr().run_single(ARGS)
+    assert get_gathered_words(gather) == ['Frau']
+    create_app_mgr().run_single(ARGS)
+    assert get_gathered_words(gather) == ['Frau']
+
+
+def test_cached_results_gathered_when_not_before(create_app_mgr, gather):
+    create_app_mgr().run_single([*ARGS, '--gather-data', 'off'])
+    assert not gather.called
+    create_app_mgr().run_single(ARGS)
+    assert get_gathered_words(gather) == ['Frau']
+    create_app_mgr().run_single(ARGS)
+    assert get_gathered_words(gather) == ['Frau']
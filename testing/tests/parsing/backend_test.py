@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+from unittest import mock
+
+import pytest
+from pandas import DataFrame
+
+from src.context_domain import html_parser
+from src.scrapping.core.parsing import query_html_parser, with_html_parser
+from src.scrapping.glosbe.parsing import TranslationParser, InflectionParser, DefinitionParser
+from src.scrapping.outcome import Outcome, OutcomeKinds
+from src.scrapping.planning import ScrapPlanner
+from src.scrapping.wiktio.scrap_adapting import WiktioScrapAdapter
+from testing.proj.mocking import PAGES, load_file, mocked_scrap, PageNotFound
+
+REFERENCE_BACKEND = 'html5lib'
+
+wiktio_langs = dict(Frau='de', Herr='de', bass='en', bord='en', conocer='es', kobieta='pl', land='en', orden='es', på='sv', water='en', 食べる='ja')
+
+
+def get_parsings(page_name: str) -> Iterable[tuple[str, Callable[[], Any]]]:
+    site, *arguments = page_name.removesuffix('.html').split('-')
+    match site, arguments:
+        case 'wiktio', [word]:
+            yield 'wiktio', lambda: WiktioScrapAdapter().scrap_wiktio_info(word, wiktio_langs[word])
+        case 'glosbe', [*_, 'details']:
+            yield 'inflection', lambda: InflectionParser.parse(load_file(PAGES / page_name))
+            yield 'grammar', lambda: InflectionParser.parse_grammar(load_file(PAGES / page_name))
+        case 'glosbe', [*_, 'indirect']:
+            yield 'indirect', lambda: TranslationParser.parse_indirect_translations(load_file(PAGES / page_name))
+        case 'glosbe', [from_lang, to_lang, _] if from_lang == to_lang:
+            yield 'definition', lambda: DefinitionParser.parse(load_file(PAGES / page_name))
+        case 'glosbe', [_, _, _]:
+            yield 'translation', lambda: TranslationParser.parse(load_file(PAGES / page_name))
+        case _:
+            raise ValueError(f'Unexpected page: {page_name}')
+
+
+def comparable(result: Any) -> Any:
+    match result:
+        case DataFrame(): return result.to_dict()
+        case Exception(): return type(result), result.args[0]
+        case _: return result
+
+
+def parse_with(backend: str, parse: Callable[[], Any]) -> Any:
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=mocked_scrap):
+        try:
+            return comparable(with_html_parser(backend).run(parse))
+        except PageNotFound as e:  # A further lookup not covered by the pages
+            return type(e), e.args[0]
+
+
+@pytest.mark.parametrize('backend', sorted(html_parser - {REFERENCE_BACKEND}))
+@pytest.mark.parametrize('parse', [
+    pytest.param(parse, id=f'{kind}-{page.name}')
+    for page in sorted(PAGES.iterdir())
+    for kind, parse in get_parsings(page.name)
+])
+def test_backend_gives_same_results(backend: str, parse: Callable[[], Any]):
+    assert parse_with(backend, parse) == parse_with(REFERENCE_BACKEND, parse)
+
+
+def test_query_steps_parse_with_its_backend():
+    with ScrapPlanner(max_workers=2, variables=with_html_parser('html5lib')) as planner:
+        step = planner.submit(lambda: Outcome(OutcomeKinds.MAIN_TRANSLATION, results=query_html_parser.get()))
+        planner.then(step, Outcome.is_success, lambda _: Outcome(OutcomeKinds.INFLECTION, results=query_html_parser.get()))
+        assert [outcome.results for outcome in planner.outcomes()] == ['html5lib', 'html5lib']
+    assert query_html_parser.get() == 'lxml'
@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+
+from src.scrapping.core.breaking import Breakers, CircuitBreaker, CircuitOpenException, CircuitState
+
+
+@pytest.fixture
+def clock():
+    with mock.patch('src.scrapping.core.breaking.time.monotonic', return_value=100.) as monotonic:
+        yield monotonic
+
+
+def open_breaker(breaker: CircuitBreaker) -> CircuitBreaker:
+    for _ in range(breaker.threshold):
+        breaker.fail()
+    return breaker
+
+
+def test_opened_after_consecutive_failures(clock):
+    breaker = CircuitBreaker('glosbe.com', threshold=3, cool_down=10.)
+
+    breaker.fail()
+    breaker.fail()
+    breaker.succeed()
+    breaker.fail()
+    breaker.fail()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.fail()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.allow()
+
+
+def test_single_probe_after_cool_down(clock):
+    breaker = open_breaker(CircuitBreaker('glosbe.com', threshold=3, cool_down=10.))
+
+    clock.return_value += 10.
+    breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenException):  # The probe still in flight
+        breaker.allow()
+
+
+def test_closed_after_probe_succeeds(clock):
+    breaker = open_breaker(CircuitBreaker('glosbe.com', threshold=3, cool_down=10.))
+    clock.return_value += 10.
+    breaker.allow()
+
+    breaker.succeed()
+
+    assert breaker.state == CircuitState.CLOSED
+    breaker.allow()
+
+
+def test_opened_again_after_probe_fails(clock):
+    breaker = open_breaker(CircuitBreaker('glosbe.com', threshold=3, cool_down=10.))
+    clock.return_value += 10.
+    breaker.allow()
+
+    breaker.fail()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.return_value += 9.
+    with pytest.raises(CircuitOpenException):
+        breaker.allow()
+
+
+def test_opened_per_host(clock):
+    breakers = Breakers()
+    open_breaker(breakers.of('https://glosbe.com/de/en/Frau'))
+
+    assert breakers.of('https://glosbe.com/de/en/Herr').is_open
+    assert not breakers.of('https://en.wiktionary.org/w/api.php').is_open
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from requests import Response
+
+from src.constants import ThrottleConstants
+from src.scrapping.core import parsing
+from src.scrapping.core.parsing import CaptchaException, Parser
+from src.scrapping.core.scrap_adapting import ScrapAdapter
+
+URL = 'https://glosbe.com/de/en/Frau'
+
+
+def create_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.url = URL
+    response._content = content
+    return response
+
+
+def test_captcha_page_tree_built_once():
+    response = create_response(f'<html><body><div class="{Parser.captcha_class}"></div></body></html>'.encode())
+    adapter = ScrapAdapter(session=mock.Mock(get=mock.Mock(return_value=response)))
+    with mock.patch.object(ThrottleConstants, 'RETRIES', 0), mock.patch.object(parsing, 'build_soup', wraps=parsing.build_soup) as build_soup:
+        result = adapter.scrap(URL, mock.Mock())
+    assert isinstance(result, CaptchaException)
+    assert build_soup.call_count == 1
+
+
+def test_page_without_marker_not_retried():
+    response = create_response(b'<html><body><div class="translation"></div></body></html>')
+    adapter = ScrapAdapter(session=mock.Mock(get=mock.Mock(return_value=response)))
+    with mock.patch.object(parsing, 'build_soup', wraps=parsing.build_soup) as build_soup:
+        assert adapter.scrap(URL, lambda _: []) == []
+    adapter.session.get.assert_called_once()
+    build_soup.assert_not_called()
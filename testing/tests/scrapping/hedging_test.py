@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from itertools import count
+from threading import Event, Thread
+from unittest import mock
+
+from src.constants import HedgeConstants
+from src.scrapping.core.scrap_adapting import ScrapAdapter
+
+URL = 'https://glosbe.com/de/en/Frau'
+
+
+def create_adapter(latencies: list[float]) -> ScrapAdapter:
+    """
+    :param latencies: of the consecutive requests sent
+    """
+    calls = count()
+    def get(*args, **kwargs) -> str:
+        time.sleep(latencies[min(i := next(calls), len(latencies) - 1)])
+        return f'response {i}'
+
+    adapter = ScrapAdapter(session=mock.Mock(get=get))
+    adapter.hedge_percentile = HedgeConstants.PERCENTILE
+    hedger = adapter.hedgers.of(URL)
+    hedger.latencies.extend([.01] * HedgeConstants.MIN_SAMPLES)
+    hedger.budget = HedgeConstants.MAX_BUDGET
+    return adapter
+
+
+def get_in_time(adapter: ScrapAdapter, timeout: float) -> str:
+    """
+    Takes the throttle's slot for the request, as ScrapAdapter._get_response does
+    """
+    responses = []
+    throttle = adapter.throttles.of(URL)
+    throttle.acquire()
+    thread = Thread(target=lambda: responses.append(adapter._get(URL, None, None, throttle)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert responses, f'No response in {timeout}s'
+    return responses[0]
+
+
+def test_slow_request_hedged():
+    adapter = create_adapter([1., 0.])
+    assert get_in_time(adapter, timeout=.5) == 'response 1'
+    assert adapter.hedgers.of(URL).hedges == 1
+
+
+def test_slot_released_once_slower_request_done():
+    adapter = create_adapter([.3, 0.])
+    throttle = adapter.throttles.of(URL)
+    assert get_in_time(adapter, timeout=.2) == 'response 1'
+    assert throttle.in_flight == 1  # The request the hedge beat is still running
+    deadline = time.monotonic() + 1.
+    while throttle.in_flight and time.monotonic() < deadline:
+        time.sleep(.01)
+    assert throttle.in_flight == 0
+
+
+def test_fast_request_not_hedged():
+    adapter = create_adapter([0.])
+    assert get_in_time(adapter, timeout=.5) == 'response 0'
+    assert adapter.hedgers.of(URL).hedges == 0
+
+
+def test_request_not_queued_behind_busy_hedges():
+    adapter = create_adapter([.05])
+    busy = Event()
+    for _ in range(HedgeConstants.MAX_WORKERS):
+        adapter.hedge_executor.submit(busy.wait)
+    try:
+        assert get_in_time(adapter, timeout=.5) == 'response 0'
+    finally:
+        busy.set()
@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+
+from src.scrapping.outcome import Outcome, OutcomeKinds
+from src.scrapping.planning import ScrapPlanner
+
+SUCCESS = Outcome(OutcomeKinds.MAIN_TRANSLATION, results=[])
+FAILURE = Outcome(OutcomeKinds.MAIN_TRANSLATION, results=ValueError('Not found'))
+SPECULATED = Outcome(OutcomeKinds.INDIRECT_TRANSLATION, results=[])
+
+
+def speculate(planner: ScrapPlanner) -> tuple[Future, Future]:
+    main, speculation = Future(), Future()
+    planner.place(main)
+    planner.speculate(main, Outcome.is_fail, speculation)
+    return main, speculation
+
+
+def test_speculation_kept_when_main_fails():
+    with ScrapPlanner(max_workers=1) as planner:
+        main, speculation = speculate(planner)
+        speculation.set_result(SPECULATED)
+        main.set_result(FAILURE)
+
+        assert list(planner.outcomes()) == [FAILURE, SPECULATED]
+
+
+def test_pending_speculation_cancelled_when_main_succeeds():
+    with ScrapPlanner(max_workers=1) as planner:
+        main, speculation = speculate(planner)
+        main.set_result(SUCCESS)
+
+        assert speculation.cancelled()
+        assert list(planner.outcomes()) == [SUCCESS]
+
+
+def test_running_speculation_unheard_when_main_succeeds():
+    with ScrapPlanner(max_workers=1) as planner:
+        main, speculation = speculate(planner)
+        speculation.set_running_or_notify_cancel()
+        main.set_result(SUCCESS)
+        speculation.set_result(SPECULATED)
+
+        assert not speculation.cancelled()
+        assert list(planner.outcomes()) == [SUCCESS]
+
+
+def test_speculation_started_along_main():
+    with ScrapPlanner(max_workers=2) as planner:
+        main = Future()
+        started = Future()
+        speculation = planner.submit(lambda: started.set_result(True) or SPECULATED, place=False)
+        planner.place(main)
+        planner.speculate(main, Outcome.is_fail, speculation)
+
+        assert started.result(timeout=1)
+        main.set_result(FAILURE)
+        assert list(planner.outcomes()) == [FAILURE, SPECULATED]
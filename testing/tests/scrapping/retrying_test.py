@@ -0,0 +1,31 @@
+from http.client import RemoteDisconnected
+
+import pytest
+from urllib3.exceptions import ProtocolError, ReadTimeoutError, NewConnectionError, MaxRetryError
+
+from src.constants import ScrapConstants
+from src.scrapping.core.web_building import StaleRetry
+
+
+def create_retry() -> StaleRetry:
+    return StaleRetry(total=ScrapConstants.STALE_RETRIES, connect=ScrapConstants.STALE_RETRIES, read=0, status=0, raise_on_status=False)
+
+
+@pytest.mark.parametrize('error', [
+    ProtocolError('Connection aborted.', RemoteDisconnected('Remote end closed connection without response')),
+    ProtocolError('Connection aborted.', BrokenPipeError()),
+    NewConnectionError(None, 'Failed to establish a new connection'),
+])
+def test_connection_failure_retried(error: Exception):
+    retry = create_retry().increment('GET', '/', error=error)
+
+    assert retry.total == ScrapConstants.STALE_RETRIES - 1
+
+
+@pytest.mark.parametrize('error', [
+    ReadTimeoutError(None, '/', 'Read timed out.'),
+    ProtocolError('Connection broken: IncompleteRead', ValueError()),
+])
+def test_read_failure_not_retried(error: Exception):
+    with pytest.raises(MaxRetryError):
+        create_retry().increment('GET', '/', error=error)
@@ -0,0 +1,79 @@
+from unittest import mock
+
+import pytest
+
+from src.constants import ThrottleConstants
+from src.scrapping.core.throttling import HostThrottle, Throttles
+
+
+@pytest.fixture
+def clock():
+    with mock.patch('src.scrapping.core.throttling.time.monotonic', return_value=100.) as monotonic:
+        yield monotonic
+
+
+def test_concurrency_limited(clock):
+    throttle = HostThrottle('glosbe.com', rate=100., limit=2.)
+
+    assert throttle.try_acquire() and throttle.try_acquire()
+    assert not throttle.try_acquire()
+    throttle.release()
+    assert throttle.try_acquire()
+
+
+def test_rate_limited(clock):
+    throttle = HostThrottle('glosbe.com', rate=1., limit=10.)
+
+    assert throttle.try_acquire()
+    assert not throttle.try_acquire()
+    clock.return_value += 1.
+    assert throttle.try_acquire()
+
+
+def test_limits_kept_per_host(clock):
+    throttles = Throttles()
+    glosbe = throttles.of('https://glosbe.com/de/en/Frau')
+    glosbe.limit = 1.
+
+    assert glosbe is throttles.of('https://GLOSBE.com/de/en/Herr')
+    assert glosbe.try_acquire() and not glosbe.try_acquire()
+    assert throttles.of('https://en.wiktionary.org/w/api.php').try_acquire()
+
+
+def test_throttling_decreases_once_per_round(clock):
+    throttle = HostThrottle('glosbe.com', rate=8., limit=8.)
+    started_at = clock.return_value
+
+    clock.return_value += 1.
+    throttle.throttle(started_at)
+    throttle.throttle(started_at)  # A request started along the first throttled one
+
+    assert throttle.limit == 8. * ThrottleConstants.DECREASE
+    assert throttle.rate == 8. * ThrottleConstants.DECREASE
+    throttle.throttle(clock.return_value)
+    assert throttle.limit == 8. * ThrottleConstants.DECREASE ** 2
+
+
+def test_throttled_host_blocked_for_retry_after(clock):
+    throttle = HostThrottle('glosbe.com', rate=100., limit=8.)
+
+    assert throttle.throttle(clock.return_value, retry_after=3.) == 3.
+    assert not throttle.try_acquire()
+    clock.return_value += 3.
+    assert throttle.try_acquire()
+
+
+def test_success_increases_up_to_max(clock):
+    throttle = HostThrottle('glosbe.com', rate=ThrottleConstants.MAX_RATE - .01, limit=4.)
+
+    throttle.succeed()
+
+    assert throttle.limit == 4. + ThrottleConstants.LIMIT_INCREASE / 4.
+    assert throttle.rate == ThrottleConstants.MAX_RATE
+
+
+@pytest.mark.parametrize('retry_after, expected', [('2', 2.), ('-1', 0.), ('soon', None), (None, None)])
+def test_retry_after_read(retry_after, expected):
+    response = mock.Mock(headers={'Retry-After': retry_after} if retry_after else {})
+
+    assert Throttles.get_retry_after(response) == expected
@@ -0,0 +1,34 @@
+from unittest import mock
+
+from src.scrapping.core.parsing import ParsingException
+from src.scrapping.wiktio.scrap_adapting import WiktioScrapAdapter
+from testing.proj.mocking import mocked_sectioned_scrap, mocked_scrap
+
+
+def scrap_wiktio_info(word: str, lang: str, scrap=mocked_sectioned_scrap) -> tuple:
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=scrap) as scrapping:
+        results = WiktioScrapAdapter(etymology_depth=0).scrap_wiktio_info(word, lang)
+    return results, [call.kwargs['params'] for call in scrapping.call_args_list]
+
+
+def test_lang_section_fetched_after_section_index():
+    results, requests = scrap_wiktio_info('Frau', 'de')
+
+    assert [params['prop'] for params in requests] == ['sections', 'text']
+    assert requests[1]['section'] == '16'
+    assert results == scrap_wiktio_info('Frau', 'de', mocked_scrap)[0]
+
+
+def test_whole_page_fetched_without_section_index():
+    results, requests = scrap_wiktio_info('Herr', 'de')
+
+    assert [params['prop'] for params in requests] == ['sections', 'text']
+    assert 'section' not in requests[1]
+    assert results == scrap_wiktio_info('Herr', 'de', mocked_scrap)[0]
+
+
+def test_missing_lang_not_fetched():
+    results, requests = scrap_wiktio_info('Frau', 'pl')
+
+    assert [params['prop'] for params in requests] == ['sections']
+    assert isinstance(results, ParsingException)
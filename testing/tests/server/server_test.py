@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator
+
+import requests
+
+from src.constants import ServerConstants
+from src.scrapping import ScrapMgr
+from src.server_managing import ServerMgr
+from testing.load.serving_load import run_load
+from testing.proj.replaying import ReplayServer
+
+FRAU = {'from_lang': 'de', 'to_lang': 'en', 'word': 'Frau'}
+
+
+@contextmanager
+def serving(latency: float, client_limit: int = ServerConstants.CLIENT_LIMIT) -> Iterator[tuple[ReplayServer, ServerMgr]]:
+    with ReplayServer(latency=latency) as replay:
+        server_mgr = ServerMgr(ScrapMgr(session=replay.create_session()), client_limit=client_limit)
+        threading.Thread(target=server_mgr.serve, name='server', daemon=True).start()
+        try:
+            yield replay, server_mgr
+        finally:
+            server_mgr.shutdown()
+
+
+def get_at_once(server_mgr: ServerMgr, clients: list[str], params: dict = FRAU) -> list[requests.Response]:
+    def get(client: str) -> requests.Response:
+        return requests.get(f'{server_mgr.address}/translation', params=params, headers={ServerConstants.CLIENT_HEADER: client})
+
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        return list(executor.map(get, clients))
+
+
+def test_client_over_limit_told_to_retry():
+    with serving(latency=.3, client_limit=1) as (_, server_mgr):
+        responses = get_at_once(server_mgr, ['a', 'a', 'b'])
+
+    assert sorted(response.status_code for response in responses[:2]) == [200, 429]
+    assert next(response for response in responses if response.status_code == 429).headers['Retry-After'] == str(ServerConstants.RETRY_AFTER)
+    assert responses[2].status_code == 200
+
+
+def test_identical_requests_coalesced():
+    with serving(latency=.3) as (replay, server_mgr):
+        get_at_once(server_mgr, ['a'])
+        upstream_requests = replay.requests
+        responses = get_at_once(server_mgr, ['a', 'b', 'c', 'd'])
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert len({response.text for response in responses}) == 1
+    assert replay.requests == 2 * upstream_requests
+    assert server_mgr.flights.saved == 3
+
+
+def test_bad_requests_answered():
+    with serving(latency=0.) as (_, server_mgr):
+        assert requests.get(f'{server_mgr.address}/nothing').status_code == 404
+        assert requests.get(f'{server_mgr.address}/translation', params={'word': 'Frau'}).status_code == 400
+
+
+def test_load_served_without_server_errors():
+    report = run_load(clients=4, threads=2, n_requests=5, latency=.02)
+
+    assert report.server_errors == 0
+    assert sum(report.statuses.values()) >= len(report.latencies) == 40
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from contextlib import nullcontext
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import yaml
+
+from src.app_managing import AppMgr
+from testing.proj.mocking import mocked_scrap
+
+ROOT = Path(__file__).parent.parent.parent.parent
+IMPORT_BUDGET = 1.  # seconds for all the imports of a cached plain translation
+LAZY_MODULES = ('pandas', 'numpy', 'GlotScript', 'apscheduler', 'tabulate', 'torch')
+ARGS = ['Frau', '-f', 'de', '-t', 'en']
+
+
+def get_imports(importtime_log: str) -> dict[str, float]:
+    """
+    :return: the cumulative seconds per module, the top-level ones unindented
+    """
+    imports = {}
+    for line in importtime_log.splitlines():
+        if line.startswith('import time:') and not line.endswith('package'):
+            _, cumulative, name = line.removeprefix('import time:').split('|')
+            imports[name.removeprefix(' ').rstrip()] = int(cumulative) / 1e6
+    return imports
+
+
+@pytest.fixture(scope='module')
+def cached_translation_imports(tmp_path_factory) -> tuple[dict[str, float], str]:
+    tmp_path = tmp_path_factory.mktemp('importtime')
+    conf_path, result_cache_dir = tmp_path / 'conf.yaml', tmp_path / 'results'
+    conf_path.write_text(yaml.safe_dump({'langs': ['de', 'en'], 'gather_data': 'all'}))
+    with mock.patch('src.scrapping.core.scrap_adapting.ScrapAdapter.scrap', side_effect=mocked_scrap), mock.patch('src.app_managing.AppMgr.connect', return_value=nullcontext(None)):
+        AppMgr(conf_path=conf_path, result_cache_dir=result_cache_dir, printer=lambda *args, **kwargs: None).run_single(ARGS)
+    script = textwrap.dedent(f'''
+        import sys
+        sys.path.insert(0, {str(ROOT)!r})
+        from src.app_managing import AppMgr
+        AppMgr(conf_path={str(conf_path)!r}, result_cache_dir={str(result_cache_dir)!r}).run_single({ARGS + ['--offline']!r})
+    ''')
+    run = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True, cwd=tmp_path, timeout=120)
+    assert run.returncode == 0, run.stderr
+    return get_imports(run.stderr), run.stdout
+
+
+def test_translation_is_cached(cached_translation_imports):
+    _, output = cached_translation_imports
+    assert 'woman' in output
+
+
+@pytest.mark.parametrize('module', LAZY_MODULES)
+def test_heavy_module_not_imported(cached_translation_imports, module: str):
+    imports, _ = cached_translation_imports
+    assert module not in map(str.strip, imports)
+
+
+def test_imports_within_budget(cached_translation_imports):
+    imports, _ = cached_translation_imports
+    total = sum(seconds for name, seconds in imports.items() if not name.startswith(' '))
+    assert total <= IMPORT_BUDGET, f'{total:.2f}s of imports, the slowest: {sorted(imports.items(), key=lambda item: -item[1])[:10]}'